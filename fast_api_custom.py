@@ -16,11 +16,12 @@ from __future__ import annotations
 
 import asyncio
 import anyio
+import collections
 from contextlib import asynccontextmanager
-import json
 import logging
 import os
 from pathlib import Path
+import threading
 import time
 import traceback
 import typing
@@ -37,16 +38,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from fastapi.responses import StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from sse_starlette import EventSourceResponse, ServerSentEvent
+from sse_starlette import EventSourceResponse
 from fastapi.websockets import WebSocket
 from fastapi.websockets import WebSocketDisconnect
 from google.genai import types
 import graphviz
+import orjson
 from opentelemetry import trace
+from opentelemetry.context import Context
 from opentelemetry.exporter.cloud_trace import CloudTraceSpanExporter
 from opentelemetry.sdk.trace import export
 from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace import Span
+from opentelemetry.sdk.trace import SpanProcessor
 from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import sampling
 from pydantic import Field
 from pydantic import ValidationError
 from starlette.types import Lifespan
@@ -56,6 +62,7 @@ from watchdog.observers import Observer
 import yaml
 
 from google.adk.agents import RunConfig
+from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.live_request_queue import LiveRequest
 from google.adk.agents.live_request_queue import LiveRequestQueue
 from google.adk.agents.run_config import StreamingMode
@@ -92,25 +99,237 @@ from google.adk.cli.utils.agent_loader import AgentLoader
 
 logger = logging.getLogger("google_adk." + __name__)
 
-_EVAL_SET_FILE_EXTENSION = ".evalset.json"
-_app_name = ""
+# Batch span processor tuning for the in-process exporters, read once at
+# startup. Defaults are sized for agent runs that emit bursts of
+# call_llm/execute_tool spans.
+_BSP_MAX_QUEUE_SIZE = int(os.environ.get("OTEL_BSP_MAX_QUEUE_SIZE", "4096"))
+_BSP_SCHEDULE_DELAY_MILLIS = int(
+    os.environ.get("OTEL_BSP_SCHEDULE_DELAY", "1000")
+)
+_BSP_MAX_EXPORT_BATCH_SIZE = int(
+    os.environ.get("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "256")
+)
+_BSP_EXPORT_TIMEOUT_MILLIS = int(
+    os.environ.get("OTEL_BSP_EXPORT_TIMEOUT", "10000")
+)
+# Connection pool for the database session service. Connections are checked
+# before use so ones dropped by the database (or a pooler) are replaced rather
+# than failing a request.
+_SESSION_DB_POOL_SIZE = int(os.environ.get("ADK_SESSION_DB_POOL_SIZE", "10"))
+_SESSION_DB_MAX_OVERFLOW = int(
+    os.environ.get("ADK_SESSION_DB_MAX_OVERFLOW", "20")
+)
+# Prefer the libyaml-backed dumper when PyYAML was built with it.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+# Upper bound on a /runv3 agent run, which is allowed to outlive the client
+# connection. Matches the 30 minute MCP toolset timeouts by default.
+_RUNV3_MAX_AGENT_SECONDS = float(
+    os.environ.get("ADK_RUNV3_MAX_AGENT_SECONDS", "1800")
+)
+# Agent runs detached from their request; referenced here until done.
+_background_tasks: set[asyncio.Task] = set()
+# How long a /runv3 run may continue after its client disconnects, so
+# in-flight tool calls can finish, before it is cancelled.
+_RUNV3_DETACHED_GRACE_SECONDS = float(
+    os.environ.get("ADK_RUNV3_DETACHED_GRACE_SECONDS", "60")
+)
+# Runs whose client has gone, by (app, user, session). A new /runv3 request
+# for the same session (e.g. a client retry) cancels the previous run.
+_detached_runs: dict[tuple[str, str, str], asyncio.Task] = {}
+# Pushed by the /runv3 heartbeat task to make the stream emit a keep-alive.
+_HEARTBEAT = object()
+# Pre-framed SSE messages. Event JSON never contains raw newlines, so each
+# payload fits on a single `data:` line.
+_SSE_DATA_PREFIX = b"data: "
+_SSE_FRAME_END = b"\n\n"
+_SSE_KEEP_ALIVE = b": keep-alive\n\n"
+# What EventSourceResponse would set, for SSE endpoints that stream through a
+# plain StreamingResponse.
+_SSE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+    "X-Accel-Buffering": "no",
+}
+# Keeps caches and proxies from holding back /run_ndjson lines.
+_NDJSON_HEADERS = {
+    "Cache-Control": "no-cache",
+    "X-Accel-Buffering": "no",
+}
+# /run_live sends this text frame after this many idle seconds so proxies and
+# load balancers do not drop quiet connections.
+_WS_PING_INTERVAL_SECONDS = 20
+_WS_PING = '{"type":"ping"}'
+# Head sampling ratio applied to root spans; children follow their parent.
+_TRACES_SAMPLER_ARG = float(os.environ.get("OTEL_TRACES_SAMPLER_ARG", "1.0"))
+# Tracer provider shared by every app built by get_fast_api_app, so repeated
+# factory calls do not orphan providers (and their exporter threads).
+_tracer_provider: Optional[TracerProvider] = None
+_tracer_provider_lock = threading.Lock()
+# Retention caps for the in-memory session trace buffer.
+_TRACE_BUFFER_SIZE = int(os.environ.get("ADK_TRACE_BUFFER", "10000"))
+_TRACE_SESSION_CACHE_SIZE = int(
+    os.environ.get("ADK_TRACE_SESSION_CACHE", "1000")
+)
+# Rendered event graphs kept per app; graphs only depend on the agent tree and
+# the highlighted edges.
+_GRAPH_CACHE_SIZE = 256
 _runners_to_clean = set()
 
+# Sorted agent names per agents directory, served by /list-apps. Invalidated
+# by AgentChangeEventHandler when reloading is on, otherwise expired by TTL.
+_APPS_CACHE_TTL_SECONDS = 5.0
+_apps_cache: dict[str, tuple[float, list[str]]] = {}
+_apps_cache_lock = threading.Lock()
+
+
+def _invalidate_apps_cache() -> None:
+  with _apps_cache_lock:
+    _apps_cache.clear()
+
+
+def _scan_agent_names(base_path: Path) -> list[str]:
+  with os.scandir(base_path) as entries:
+    return sorted(
+        entry.name
+        for entry in entries
+        if entry.is_dir()
+        and not entry.name.startswith(".")
+        and entry.name != "__pycache__"
+    )
+
+
+def _get_cached_agent_names(
+    base_path: Path, ttl: Optional[float]
+) -> Optional[list[str]]:
+  """Returns the cached agent names, or None on a miss or expiry."""
+  with _apps_cache_lock:
+    cached = _apps_cache.get(str(base_path))
+  if cached is None:
+    return None
+  if ttl is not None and time.monotonic() - cached[0] >= ttl:
+    return None
+  return cached[1]
+
+
+def _load_agent_names(base_path: Path) -> list[str]:
+  """Scans the agents directory and refreshes the cache. Blocking."""
+  now = time.monotonic()
+  # Let scandir report a missing path or non-directory instead of stat-ing
+  # the base path twice up front.
+  try:
+    agent_names = _scan_agent_names(base_path)
+  except FileNotFoundError as e:
+    raise HTTPException(status_code=404, detail="Path not found") from e
+  except NotADirectoryError as e:
+    raise HTTPException(status_code=400, detail="Not a directory") from e
+  with _apps_cache_lock:
+    _apps_cache[str(base_path)] = (now, agent_names)
+  return agent_names
+
 
 class AgentChangeEventHandler(FileSystemEventHandler):
+  """Evicts an agent from the loader cache when its source files change."""
+
+  # Editors typically emit several events per save (temp file, rename,
+  # modify); evictions for the same app within this window are coalesced.
+  DEBOUNCE_SECONDS = 0.5
 
-  def __init__(self, agent_loader: AgentLoader):
+  def __init__(self, agent_loader: AgentLoader, agents_dir: str):
     self.agent_loader = agent_loader
+    self.agents_dir = Path(agents_dir).resolve()
+    self._last_evict: dict[str, float] = {}
 
-  def on_modified(self, event):
-    if not (event.src_path.endswith(".py") or event.src_path.endswith(".yaml")):
+  def _get_app_name(self, src_path: str) -> Optional[str]:
+    """Maps a changed file to the agent directory that contains it."""
+    try:
+      parts = Path(src_path).resolve().relative_to(self.agents_dir).parts
+    except ValueError:
+      return None
+    # Files directly under agents_dir do not belong to any agent.
+    if len(parts) < 2 or "__pycache__" in parts:
+      return None
+    return parts[0]
+
+  def _handle_change(self, event, path: str) -> None:
+    if event.is_directory:
       return
-    logger.info("Change detected in agents directory: %s", event.src_path)
-    self.agent_loader.remove_agent_from_cache(_app_name)
-    _runners_to_clean.add(_app_name)
+    if not (path.endswith(".py") or path.endswith(".yaml")):
+      return
+    app_name = self._get_app_name(path)
+    if app_name is None:
+      return
+    now = time.monotonic()
+    if now - self._last_evict.get(app_name, 0.0) < self.DEBOUNCE_SECONDS:
+      return
+    self._last_evict[app_name] = now
+    logger.info("Change detected in agents directory: %s", path)
+    self.agent_loader.remove_agent_from_cache(app_name)
+    _runners_to_clean.add(app_name)
+
+  def on_created(self, event):
+    _invalidate_apps_cache()
+    self._handle_change(event, event.src_path)
+
+  def on_deleted(self, event):
+    _invalidate_apps_cache()
+
+  def on_moved(self, event):
+    _invalidate_apps_cache()
+    self._handle_change(event, event.dest_path)
+
+  def on_modified(self, event):
+    self._handle_change(event, event.src_path)
+
+
+_API_SERVER_SPAN_NAMES = frozenset({"call_llm", "send_data"})
+
+
+def _is_api_server_span(span: ReadableSpan) -> bool:
+  name = span.name
+  return name in _API_SERVER_SPAN_NAMES or name.startswith("execute_tool")
+
+
+class FilteringSpanProcessor(SpanProcessor):
+  """Forwards only the spans matching `predicate` to the wrapped processor.
+
+  Filtering in `on_end` keeps unwanted spans out of the export queue
+  entirely, instead of paying for them in the exporter.
+  """
+
+  def __init__(
+      self,
+      processor: SpanProcessor,
+      predicate: typing.Callable[[ReadableSpan], bool],
+  ):
+    self._processor = processor
+    self._predicate = predicate
+
+  @override
+  def on_start(
+      self, span: Span, parent_context: Optional[Context] = None
+  ) -> None:
+    self._processor.on_start(span, parent_context=parent_context)
+
+  @override
+  def on_end(self, span: ReadableSpan) -> None:
+    if self._predicate(span):
+      self._processor.on_end(span)
+
+  @override
+  def shutdown(self) -> None:
+    self._processor.shutdown()
+
+  @override
+  def force_flush(self, timeout_millis: int = 30000) -> bool:
+    return self._processor.force_flush(timeout_millis)
 
 
 class ApiServerSpanExporter(export.SpanExporter):
+  """Indexes span attributes by event id for the /debug/trace endpoint.
+
+  Expects to be fed only `call_llm`/`send_data`/`execute_tool*` spans, see
+  `FilteringSpanProcessor`.
+  """
 
   def __init__(self, trace_dict):
     self.trace_dict = trace_dict
@@ -119,16 +338,15 @@ class ApiServerSpanExporter(export.SpanExporter):
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export.SpanExportResult:
     for span in spans:
-      if (
-          span.name == "call_llm"
-          or span.name == "send_data"
-          or span.name.startswith("execute_tool")
-      ):
-        attributes = dict(span.attributes)
-        attributes["trace_id"] = span.get_span_context().trace_id
-        attributes["span_id"] = span.get_span_context().span_id
-        if attributes.get("gcp.vertex.agent.event_id", None):
-          self.trace_dict[attributes["gcp.vertex.agent.event_id"]] = attributes
+      event_id = span.attributes.get("gcp.vertex.agent.event_id", None)
+      if not event_id:
+        continue
+      # Only copy the attributes once we know the span is being stored.
+      attributes = dict(span.attributes)
+      span_context = span.get_span_context()
+      attributes["trace_id"] = span_context.trace_id
+      attributes["span_id"] = span_context.span_id
+      self.trace_dict[event_id] = attributes
     return export.SpanExportResult.SUCCESS
 
   def force_flush(self, timeout_millis: int = 30000) -> bool:
@@ -137,26 +355,39 @@ class ApiServerSpanExporter(export.SpanExporter):
 
 class InMemoryExporter(export.SpanExporter):
 
-  def __init__(self, trace_dict):
+  def __init__(
+      self,
+      trace_dict: collections.OrderedDict[str, list[int]],
+      max_spans: int = _TRACE_BUFFER_SIZE,
+      max_sessions: int = _TRACE_SESSION_CACHE_SIZE,
+  ):
     super().__init__()
-    self._spans = []
+    # Oldest spans and least recently traced sessions are evicted first so a
+    # long-running server does not grow the buffer without bound.
+    self._spans = collections.deque(maxlen=max_spans)
+    self._max_sessions = max_sessions
+    # export() runs on the batch processor thread while get_finished_spans()
+    # is called from request handlers.
+    self._lock = threading.Lock()
     self.trace_dict = trace_dict
 
   @override
   def export(
       self, spans: typing.Sequence[ReadableSpan]
   ) -> export.SpanExportResult:
-    for span in spans:
-      trace_id = span.context.trace_id
-      if span.name == "call_llm":
-        attributes = dict(span.attributes)
-        session_id = attributes.get("gcp.vertex.agent.session_id", None)
+    with self._lock:
+      for span in spans:
+        if span.name != "call_llm":
+          continue
+        session_id = span.attributes.get("gcp.vertex.agent.session_id", None)
         if session_id:
-          if session_id not in self.trace_dict:
-            self.trace_dict[session_id] = [trace_id]
-          else:
-            self.trace_dict[session_id] += [trace_id]
-    self._spans.extend(spans)
+          self.trace_dict.setdefault(session_id, []).append(
+              span.context.trace_id
+          )
+          self.trace_dict.move_to_end(session_id)
+          if len(self.trace_dict) > self._max_sessions:
+            self.trace_dict.popitem(last=False)
+      self._spans.extend(spans)
     return export.SpanExportResult.SUCCESS
 
   @override
@@ -164,13 +395,91 @@ class InMemoryExporter(export.SpanExporter):
     return True
 
   def get_finished_spans(self, session_id: str):
-    trace_ids = self.trace_dict.get(session_id, None)
-    if trace_ids is None or not trace_ids:
-      return []
-    return [x for x in self._spans if x.context.trace_id in trace_ids]
+    with self._lock:
+      trace_ids = self.trace_dict.get(session_id, None)
+      if not trace_ids:
+        return []
+      trace_ids = set(trace_ids)
+      return [x for x in self._spans if x.context.trace_id in trace_ids]
 
   def clear(self):
-    self._spans.clear()
+    with self._lock:
+      self._spans.clear()
+
+
+def _batch_span_processor(
+    exporter: export.SpanExporter,
+) -> export.BatchSpanProcessor:
+  """Wraps an exporter so spans are exported off the request path."""
+  return export.BatchSpanProcessor(
+      exporter,
+      max_queue_size=_BSP_MAX_QUEUE_SIZE,
+      schedule_delay_millis=_BSP_SCHEDULE_DELAY_MILLIS,
+      max_export_batch_size=_BSP_MAX_EXPORT_BATCH_SIZE,
+      export_timeout_millis=_BSP_EXPORT_TIMEOUT_MILLIS,
+  )
+
+
+def _get_tracer_provider() -> TracerProvider:
+  """Returns the module's tracer provider, creating and installing it once.
+
+  An SDK provider already installed by the entry point is reused, since a
+  second provider could not become the global one and would never see spans.
+  """
+  global _tracer_provider
+  with _tracer_provider_lock:
+    if _tracer_provider is None:
+      installed = trace.get_tracer_provider()
+      if isinstance(installed, TracerProvider):
+        _tracer_provider = installed
+      else:
+        _tracer_provider = TracerProvider(
+            sampler=sampling.ParentBasedTraceIdRatio(_TRACES_SAMPLER_ARG)
+        )
+        trace.set_tracer_provider(_tracer_provider)
+    return _tracer_provider
+
+
+def _sse_frame(event: bytes, data: bytes, id_: Optional[str] = None) -> bytes:
+  """Builds one SSE message from an event name and single-line JSON data.
+
+  Built directly as bytes, skipping ServerSentEvent's str formatting and
+  UTF-8 encode.
+  """
+  parts = [b"event: ", event, b"\n", _SSE_DATA_PREFIX, data, b"\n"]
+  if id_:
+    parts.extend((b"id: ", id_.encode(), b"\n"))
+  parts.append(b"\n")
+  return b"".join(parts)
+
+
+def _run_config(req: "AgentRunRequest") -> RunConfig:
+  """Returns the run config for a request, streaming partial text if asked."""
+  return RunConfig(
+      streaming_mode=StreamingMode.SSE if req.streaming else StreamingMode.NONE
+  )
+
+
+_SSE_STREAM_COMPLETE = _sse_frame(
+    b"stream_complete", b'{"type":"stream_complete"}'
+)
+
+
+def _find_render_session_url(event: Event) -> Optional[str]:
+  """Returns the url of a `render_session` call in the event, if any.
+
+  Walks the event's parts on the model itself so callers do not have to
+  dump the whole event to a dict just to look for the call. This is the
+  same walk as `Event.get_function_calls()`, minus building the list, and
+  it stops at the first match; events without content return immediately.
+  """
+  if not event.content or not event.content.parts:
+    return None
+  for part in event.content.parts:
+    function_call = part.function_call
+    if function_call and function_call.name == "render_session":
+      return (function_call.args or {}).get("url", "")
+  return None
 
 
 class AgentRunRequest(common.BaseModel):
@@ -240,29 +549,36 @@ def get_fast_api_app(
 ) -> FastAPI:
   # InMemory tracing dict.
   trace_dict: dict[str, Any] = {}
-  session_trace_dict: dict[str, Any] = {}
-
-  # Set up tracing in the FastAPI server.
-  provider = TracerProvider()
-  provider.add_span_processor(
-      export.SimpleSpanProcessor(ApiServerSpanExporter(trace_dict))
+  session_trace_dict: collections.OrderedDict[str, list[int]] = (
+      collections.OrderedDict()
   )
+
+  # Set up tracing in the FastAPI server. The span processors belong to this
+  # app and are shut down with it; the provider itself is shared.
+  provider = _get_tracer_provider()
+  span_processors: list[SpanProcessor] = [
+      FilteringSpanProcessor(
+          _batch_span_processor(ApiServerSpanExporter(trace_dict)),
+          _is_api_server_span,
+      )
+  ]
   memory_exporter = InMemoryExporter(session_trace_dict)
-  provider.add_span_processor(export.SimpleSpanProcessor(memory_exporter))
+  span_processors.append(_batch_span_processor(memory_exporter))
   if trace_to_cloud:
     envs.load_dotenv_for_agent("", agents_dir)
     if project_id := os.environ.get("GOOGLE_CLOUD_PROJECT", None):
-      processor = export.BatchSpanProcessor(
-          CloudTraceSpanExporter(project_id=project_id)
+      span_processors.append(
+          export.BatchSpanProcessor(
+              CloudTraceSpanExporter(project_id=project_id)
+          )
       )
-      provider.add_span_processor(processor)
     else:
       logger.warning(
           "GOOGLE_CLOUD_PROJECT environment variable is not set. Tracing will"
           " not be enabled."
       )
-
-  trace.set_tracer_provider(provider)
+  for span_processor in span_processors:
+    provider.add_span_processor(span_processor)
 
   @asynccontextmanager
   async def internal_lifespan(app: FastAPI):
@@ -278,6 +594,9 @@ def get_fast_api_app(
         observer.join()
       # Create tasks for all runner closures to run concurrently
       await cleanup.close_runners(list(runner_dict.values()))
+      # Flush pending spans and stop the batch export threads.
+      for span_processor in span_processors:
+        span_processor.shutdown()
 
   # Run the FastAPI server.
   app = FastAPI(lifespan=internal_lifespan)
@@ -292,6 +611,14 @@ def get_fast_api_app(
     )
 
   runner_dict = {}
+  runner_locks: dict[str, asyncio.Lock] = {}
+  # Apps whose .env has already been loaded into the process environment.
+  envs_loaded: set[str] = set()
+  # (app_name, highlights) -> (root_agent, dot source). The agent is kept so
+  # a reloaded agent never serves a graph rendered from the old tree.
+  graph_cache: collections.OrderedDict[
+      tuple[str, tuple[tuple[str, str], ...]], tuple[BaseAgent, str]
+  ] = collections.OrderedDict()
 
   # Set up eval managers.
   eval_sets_manager = None
@@ -347,7 +674,12 @@ def get_fast_api_app(
           agent_engine_id=agent_engine_id,
       )
     else:
-      session_service = DatabaseSessionService(db_url=session_service_uri)
+      session_service = DatabaseSessionService(
+          db_url=session_service_uri,
+          pool_pre_ping=True,
+          pool_size=_SESSION_DB_POOL_SIZE,
+          max_overflow=_SESSION_DB_MAX_OVERFLOW,
+      )
   else:
     session_service = InMemorySessionService()
 
@@ -372,29 +704,25 @@ def get_fast_api_app(
   # Set up a file system watcher to detect changes in the agents directory.
   observer = Observer()
   if reload_agents:
-    event_handler = AgentChangeEventHandler(agent_loader)
+    event_handler = AgentChangeEventHandler(agent_loader, agents_dir)
     observer.schedule(event_handler, agents_dir, recursive=True)
     observer.start()
 
   @app.get("/list-apps")
-  def list_apps() -> list[str]:
+  async def list_apps() -> list[str]:
     base_path = Path.cwd() / agents_dir
-    if not base_path.exists():
-      raise HTTPException(status_code=404, detail="Path not found")
-    if not base_path.is_dir():
-      raise HTTPException(status_code=400, detail="Not a directory")
-    agent_names = [
-        x
-        for x in os.listdir(base_path)
-        if os.path.isdir(os.path.join(base_path, x))
-        and not x.startswith(".")
-        and x != "__pycache__"
-    ]
-    agent_names.sort()
-    return agent_names
+    # With reload_agents the watcher invalidates the cache on changes, so no
+    # expiry is needed.
+    ttl = None if reload_agents else _APPS_CACHE_TTL_SECONDS
+    agent_names = _get_cached_agent_names(base_path, ttl)
+    if agent_names is None:
+      agent_names = await anyio.to_thread.run_sync(
+          _load_agent_names, base_path
+      )
+    return list(agent_names)
 
   @app.get("/debug/trace/{event_id}")
-  def get_trace_dict(event_id: str) -> Any:
+  async def get_trace_dict(event_id: str) -> Any:
     event_dict = trace_dict.get(event_id, None)
     if event_dict is None:
       raise HTTPException(status_code=404, detail="Trace not found")
@@ -430,9 +758,6 @@ def get_fast_api_app(
     )
     if not session:
       raise HTTPException(status_code=404, detail="Session not found")
-
-    global _app_name
-    _app_name = app_name
     return session
 
   @app.get(
@@ -496,13 +821,6 @@ def get_fast_api_app(
 
     return session
 
-  def _get_eval_set_file_path(app_name, agents_dir, eval_set_id) -> str:
-    return os.path.join(
-        agents_dir,
-        app_name,
-        eval_set_id + _EVAL_SET_FILE_EXTENSION,
-    )
-
   @app.post(
       "/apps/{app_name}/eval_sets/{eval_set_id}",
       response_model_exclude_none=True,
@@ -571,19 +889,21 @@ def get_fast_api_app(
       "/apps/{app_name}/eval_sets/{eval_set_id}/evals",
       response_model_exclude_none=True,
   )
-  def list_evals_in_eval_set(
+  async def list_evals_in_eval_set(
       app_name: str,
       eval_set_id: str,
   ) -> list[str]:
     """Lists all evals in an eval set."""
-    eval_set_data = eval_sets_manager.get_eval_set(app_name, eval_set_id)
+    eval_set_data = await anyio.to_thread.run_sync(
+        eval_sets_manager.get_eval_set, app_name, eval_set_id
+    )
 
     if not eval_set_data:
       raise HTTPException(
           status_code=400, detail=f"Eval set `{eval_set_id}` not found."
       )
 
-    return sorted([x.eval_id for x in eval_set_data.eval_cases])
+    return sorted(x.eval_id for x in eval_set_data.eval_cases)
 
   @app.get(
       "/apps/{app_name}/eval_sets/{eval_set_id}/evals/{eval_case_id}",
@@ -667,6 +987,9 @@ def get_fast_api_app(
     root_agent = agent_loader.load_agent(app_name)
     run_eval_results = []
     eval_case_results = []
+    # Session lookups are started as results arrive and awaited together, so
+    # they overlap with the remaining eval runs instead of serializing them.
+    session_tasks = []
     try:
       async for eval_case_result in run_evals(
           eval_set_to_evals,
@@ -676,9 +999,10 @@ def get_fast_api_app(
           session_service=session_service,
           artifact_service=artifact_service,
       ):
+        # All fields come from an already validated eval case result, so
+        # skip re-validating them.
         run_eval_results.append(
-            RunEvalResult(
-                app_name=app_name,
+            RunEvalResult.model_construct(
                 eval_set_file=eval_case_result.eval_set_file,
                 eval_set_id=eval_set_id,
                 eval_id=eval_case_result.eval_id,
@@ -690,16 +1014,26 @@ def get_fast_api_app(
                 session_id=eval_case_result.session_id,
             )
         )
-        eval_case_result.session_details = await session_service.get_session(
-            app_name=app_name,
-            user_id=eval_case_result.user_id,
-            session_id=eval_case_result.session_id,
+        session_tasks.append(
+            asyncio.create_task(
+                session_service.get_session(
+                    app_name=app_name,
+                    user_id=eval_case_result.user_id,
+                    session_id=eval_case_result.session_id,
+                )
+            )
         )
         eval_case_results.append(eval_case_result)
     except ModuleNotFoundError as e:
+      for task in session_tasks:
+        task.cancel()
       logger.exception("%s", e)
       raise HTTPException(status_code=400, detail=str(e)) from e
 
+    sessions = await asyncio.gather(*session_tasks)
+    for eval_case_result, session in zip(eval_case_results, sessions):
+      eval_case_result.session_details = session
+
     eval_set_results_manager.save_eval_set_result(
         app_name, eval_set_id, eval_case_results
     )
@@ -728,9 +1062,11 @@ def get_fast_api_app(
       "/apps/{app_name}/eval_results",
       response_model_exclude_none=True,
   )
-  def list_eval_results(app_name: str) -> list[str]:
+  async def list_eval_results(app_name: str) -> list[str]:
     """Lists all eval results for the given app."""
-    return eval_set_results_manager.list_eval_set_results(app_name)
+    return await anyio.to_thread.run_sync(
+        eval_set_results_manager.list_eval_set_results, app_name
+    )
 
   @app.delete("/apps/{app_name}/users/{user_id}/sessions/{session_id}")
   async def delete_session(app_name: str, user_id: str, session_id: str):
@@ -831,13 +1167,20 @@ def get_fast_api_app(
         "description": req.description,
         "instruction": f"""{req.instruction}""",
     }
-    try:
+
+    def _save_and_load_agent() -> None:
       agent_dir = os.path.join(base_path, req.agent_name)
       os.makedirs(agent_dir, exist_ok=True)
       file_path = os.path.join(agent_dir, "root_agent.yaml")
       with open(file_path, "w") as file:
-        yaml.dump(agent, file, default_flow_style=False)
+        yaml.dump(
+            agent, file, Dumper=_YAML_DUMPER, default_flow_style=False
+        )
       agent_loader.load_agent(agent_name=req.agent_name)
+
+    try:
+      # Disk writes and agent loading are blocking; keep them off the loop.
+      await anyio.to_thread.run_sync(_save_and_load_agent)
       return True
     except Exception as e:
       logger.exception("Error in builder_build: %s", e)
@@ -850,7 +1193,9 @@ def get_fast_api_app(
     )
     if not session:
       raise HTTPException(status_code=404, detail="Session not found")
-    runner = await _get_runner_async(req.app_name)
+    runner = _get_cached_runner(req.app_name) or await _get_runner_async(
+        req.app_name
+    )
     events = [
         event
         async for event in runner.run_async(
@@ -859,52 +1204,96 @@ def get_fast_api_app(
             new_message=req.new_message,
         )
     ]
-    logger.info("Generated %s events in agent run: %s", len(events), events)
+    logger.info("Generated %s events in agent run", len(events))
     return events
 
+  @app.post("/run_ndjson")
+  async def agent_run_ndjson(req: AgentRunRequest) -> StreamingResponse:
+    """Same as /run, but streams events as newline-delimited JSON.
+
+    Each event is written as soon as the runner yields it, so only one event
+    is held in memory at a time instead of the whole run.
+    """
+    session = await session_service.get_session(
+        app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
+    )
+    if not session:
+      raise HTTPException(status_code=404, detail="Session not found")
+    runner = _get_cached_runner(req.app_name) or await _get_runner_async(
+        req.app_name
+    )
+
+    async def event_generator():
+      event_count = 0
+      async for event in runner.run_async(
+          user_id=req.user_id,
+          session_id=req.session_id,
+          new_message=req.new_message,
+          run_config=_run_config(req),
+      ):
+        event_count += 1
+        yield event.__pydantic_serializer__.to_json(
+            event, exclude_none=True, by_alias=True
+        ) + b"\n"
+      logger.info("Generated %s events in agent run", event_count)
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="application/x-ndjson",
+        headers=_NDJSON_HEADERS,
+    )
+
   @app.post("/runv2")
-  async def agent_run_v2(req: AgentRunRequest) -> StreamingResponse:
+  async def agent_run_v2(req: AgentRunRequest) -> EventSourceResponse:
     session = await session_service.get_session(
         app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
     )
     if not session:
       raise HTTPException(status_code=404, detail="Session not found")
-          
-    runner = await _get_runner_async(req.app_name)
+
+    runner = _get_cached_runner(req.app_name) or await _get_runner_async(
+        req.app_name
+    )
 
     async def event_generator():
       try:
-        # Add heartbeat to keep connection alive during streaming
-        yield f"data: {{\"type\": \"stream_start\", \"session_id\": \"{req.session_id}\"}}\n\n"
-        
+        yield (
+            _SSE_DATA_PREFIX
+            + orjson.dumps(
+                {"type": "stream_start", "session_id": req.session_id}
+            )
+            + _SSE_FRAME_END
+        )
+
         async for event in runner.run_async(
             user_id=req.user_id,
             session_id=req.session_id,
             new_message=req.new_message,
+            run_config=_run_config(req),
         ):
-          # Stream events as SSE
-          event_data = event.model_dump_json(exclude_none=True, by_alias=True)
-          logger.info("Generated event in agent runv2: %s", event_data)
-          yield f"data: {event_data}\n\n"
-        
+          # Serialize straight to bytes; EventSourceResponse passes bytes
+          # through without re-encoding.
+          event_data = event.__pydantic_serializer__.to_json(
+              event, exclude_none=True, by_alias=True
+          )
+          if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("runv2 event bytes=%d", len(event_data))
+          yield _SSE_DATA_PREFIX + event_data + _SSE_FRAME_END
+
         # Signal completion
-        yield f"data: {{\"type\": \"stream_complete\"}}\n\n"
-          
+        yield _SSE_STREAM_COMPLETE
+
       except Exception as e:
         logger.exception("Error in runv2 event_generator: %s", e)
-        yield f'data: {{"type": "error", "error": "{str(e)}"}}\n\n'
+        yield (
+            _SSE_DATA_PREFIX
+            + orjson.dumps({"type": "error", "error": str(e)})
+            + _SSE_FRAME_END
+        )
 
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-            "X-Accel-Buffering": "no",  # Disable nginx buffering for real-time streaming
-        }
-    )
-  
-  
+    # EventSourceResponse sets the no-cache/keep-alive/no-buffering headers
+    # and sends periodic pings to keep idle connections open.
+    return EventSourceResponse(event_generator())
 
   @app.post("/run_sse")
   async def agent_run_sse(req: AgentRunRequest) -> StreamingResponse:
@@ -918,36 +1307,50 @@ def get_fast_api_app(
     # Convert the events to properly formatted SSE
     async def event_generator():
       try:
-        stream_mode = StreamingMode.SSE if req.streaming else StreamingMode.NONE
-        runner = await _get_runner_async(req.app_name)
+        runner = _get_cached_runner(
+            req.app_name
+        ) or await _get_runner_async(req.app_name)
         async for event in runner.run_async(
             user_id=req.user_id,
             session_id=req.session_id,
             new_message=req.new_message,
             state_delta=req.state_delta,
-            run_config=RunConfig(streaming_mode=stream_mode),
+            run_config=_run_config(req),
         ):
           # Format as SSE data
-          sse_event = event.model_dump_json(exclude_none=True, by_alias=True)
-          logger.info("Generated event in agent run streaming: %s", sse_event)
-          yield f"data: {sse_event}\n\n"
+          sse_event = event.__pydantic_serializer__.to_json(
+              event, exclude_none=True, by_alias=True
+          )
+          if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Generated event in agent run streaming: %s",
+                sse_event.decode(),
+            )
+          yield _SSE_DATA_PREFIX + sse_event + _SSE_FRAME_END
       except Exception as e:
         logger.exception("Error in event_generator: %s", e)
         # You might want to yield an error event here
-        yield f'data: {{"error": "{str(e)}"}}\n\n'
+        yield (
+            _SSE_DATA_PREFIX
+            + orjson.dumps({"error": str(e)})
+            + _SSE_FRAME_END
+        )
 
-    # Returns a streaming response with the proper media type for SSE
+    # Returns a streaming response with the proper media type for SSE; the
+    # headers keep proxies from buffering the stream until it completes.
     return StreamingResponse(
         event_generator(),
         media_type="text/event-stream",
+        headers=_SSE_HEADERS,
     )
 
   @app.post("/runv3")
-  async def agent_run_v3(req: AgentRunRequest) -> EventSourceResponse:
+  async def agent_run_v3(req: AgentRunRequest) -> StreamingResponse:
     """
     Improved streaming endpoint with cancellation-safe MCP session handling.
-    Uses anyio.CancelScope to shield agent execution from HTTP stream cancellation.
-    Now using sse-starlette for clean SSE event formatting.
+    The agent runs in its own task, so HTTP stream cancellation does not
+    interrupt it; runs are bounded by _RUNV3_MAX_AGENT_SECONDS, and by
+    _RUNV3_DETACHED_GRACE_SECONDS once the client is gone.
     """
     session = await session_service.get_session(
         app_name=req.app_name, user_id=req.user_id, session_id=req.session_id
@@ -955,108 +1358,209 @@ def get_fast_api_app(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    runner = await _get_runner_async(req.app_name)
+    run_key = (req.app_name, req.user_id, req.session_id)
+    stale_run = _detached_runs.pop(run_key, None)
+    if stale_run is not None:
+        # The client retried: stop the orphaned run so two runs never write
+        # to the same session.
+        stale_run.cancel()
+        await asyncio.wait({stale_run}, timeout=5)
 
-    HEARTBEAT_EVERY = 20  # seconds
+    runner = _get_cached_runner(req.app_name) or await _get_runner_async(
+        req.app_name
+    )
 
-    # Bridge queue between agent and HTTP stream
-    queue: asyncio.Queue[Event | None] = asyncio.Queue()
+    HEARTBEAT_EVERY = 20  # seconds
+    MAX_EVENTS_PER_WRITE = 32
+    # Agent events buffered ahead of a slow client before the agent waits.
+    MAX_PENDING_EVENTS = 64
+
+    # Bridge between agent and HTTP stream: a plain deque plus wake-up events
+    # avoids the future bookkeeping asyncio.Queue does per put/get.
+    pending: collections.deque[Event | object | None] = collections.deque()
+    has_data = asyncio.Event()
+    has_room = asyncio.Event()
+    has_room.set()
+    client_gone = False
+
+    def push(item: Event | object | None) -> None:
+        """Enqueues without waiting; for heartbeats and the sentinel."""
+        pending.append(item)
+        has_data.set()
+
+    async def push_event(ev: Event) -> None:
+        """Enqueues an agent event, waiting while the buffer is full.
+
+        Suspending here suspends the agent's generator, so a slow client
+        slows the agent down instead of growing the buffer. Once the client
+        is gone events are dropped and the agent runs on unthrottled.
+        """
+        while len(pending) >= MAX_PENDING_EVENTS and not client_gone:
+            has_room.clear()
+            await has_room.wait()
+        if client_gone:
+            return
+        push(ev)
+
+    async def next_item() -> Event | object | None:
+        while not pending:
+            has_data.clear()
+            await has_data.wait()
+        item = pending.popleft()
+        has_room.set()
+        return item
 
     async def pump_agent():
-        """Run the agent in a shielded scope and push events to queue."""
-        with anyio.CancelScope(shield=True):
-            try:
+        """Run the agent and push events to the stream.
+
+        The run is not tied to the HTTP stream: if the client disconnects the
+        agent keeps going so in-flight MCP calls are not torn down. A deadline
+        bounds runaway runs instead.
+        """
+        try:
+            with anyio.move_on_after(_RUNV3_MAX_AGENT_SECONDS) as deadline:
                 async for ev in runner.run_async(
                     user_id=req.user_id,
                     session_id=req.session_id,
                     new_message=req.new_message,
+                    run_config=_run_config(req),
                 ):
-                    await queue.put(ev)
+                    await push_event(ev)
+            if deadline.cancelled_caught:
+                logger.warning(
+                    "Agent run for session %s exceeded %ss and was stopped",
+                    req.session_id,
+                    _RUNV3_MAX_AGENT_SECONDS,
+                )
+            else:
                 logger.info("Agent execution completed for session: %s", req.session_id)
-            except Exception as e:
-                logger.exception("Agent run failed: %s", e)
-                # Create a proper error event matching the Event schema
-                # Note: Adjust this based on your actual Event model structure
-                try:
-                    from google.adk.events.event import Event as EventClass
-                    error_event = EventClass(type="agent_error", message=str(e))
-                    await queue.put(error_event)
-                except:
-                    # Fallback if Event class doesn't support this structure
-                    await queue.put(None)  # Just end the stream on error
-            finally:
-                await queue.put(None)  # sentinel
+        except Exception as e:
+            logger.exception("Agent run failed: %s", e)
+            # Pre-encoded frame; the stream writes bytes items as they are.
+            push(_sse_frame(
+                b"error", orjson.dumps({"type": "error", "error": str(e)})
+            ))
+        finally:
+            push(None)  # sentinel
+
+    async def heartbeat():
+        """Periodically wakes the stream so it can send a keep-alive."""
+        while True:
+            await asyncio.sleep(HEARTBEAT_EVERY)
+            push(_HEARTBEAT)
 
     pump_task = asyncio.create_task(pump_agent())
+    # Keep a strong reference: the run may outlive this request.
+    _background_tasks.add(pump_task)
+    pump_task.add_done_callback(_background_tasks.discard)
+    heartbeat_task = asyncio.create_task(heartbeat())
+
+    def detach_run() -> None:
+        """Gives a run whose client is gone a grace period, then cancels it."""
+        if pump_task.done():
+            return
+        _detached_runs[run_key] = pump_task
+        grace = asyncio.get_running_loop().call_later(
+            _RUNV3_DETACHED_GRACE_SECONDS, pump_task.cancel
+        )
+
+        def forget(task: asyncio.Task) -> None:
+            grace.cancel()
+            if _detached_runs.get(run_key) is task:
+                del _detached_runs[run_key]
+
+        pump_task.add_done_callback(forget)
+
+    def encode_event(item: Event) -> bytes:
+        ev_id = item.id
+        # Check if this is a render_session function call (can be in any part)
+        render_session_url = _find_render_session_url(item)
+
+        if render_session_url:
+            # Send custom render_session event
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent render_session event with URL: %s", render_session_url)
+            return _sse_frame(
+                b"render_session",
+                orjson.dumps({"type": "render_session", "url": render_session_url}),
+                ev_id,
+            )
+
+        # Send regular agent event, serialized straight to bytes
+        payload = item.__pydantic_serializer__.to_json(
+            item, exclude_none=True, by_alias=True
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Streaming event in runv3: %s", payload.decode())
+        return _sse_frame(
+            b"agent_event",
+            payload,
+            ev_id,
+        )
 
     async def event_generator():
+        nonlocal client_gone
         # Stream start event
-        yield ServerSentEvent(
-            data=f'{{"type":"stream_start","session_id":"{req.session_id}"}}',
-            event="stream_start"
+        yield _sse_frame(
+            b"stream_start",
+            orjson.dumps({"type": "stream_start", "session_id": req.session_id}),
         )
-        
+
         try:
-            while True:
-                try:
-                    item = await asyncio.wait_for(queue.get(), timeout=HEARTBEAT_EVERY)
-                except asyncio.TimeoutError:
-                    # Heartbeat using sse-starlette's comment format
-                    yield ServerSentEvent(comment="keep-alive")
+            done = False
+            while not done:
+                item = await next_item()
+                if item is _HEARTBEAT:
+                    # Heartbeat as an SSE comment
+                    yield _SSE_KEEP_ALIVE
                     continue
 
-                if item is None:  # sentinel => done
-                    break
-                
-                # Check if this is a render_session function call (can be in any part)
-                item_dict = item.model_dump(exclude_none=True, by_alias=True)
-                render_session_url = None
-                
-                # Look through all parts for render_session function call
-                if item_dict.get("content", {}).get("parts"):
-                    for part in item_dict["content"]["parts"]:
-                        if (part.get("functionCall", {}).get("name") == "render_session"):
-                            render_session_url = part["functionCall"].get("args", {}).get("url", "")
-                            break
-                
-                if render_session_url:
-                    # Send custom render_session event
-                    yield ServerSentEvent(
-                        data=f'{{"type": "render_session", "url": "{render_session_url}"}}',
-                        event="render_session",
-                        id=getattr(item, 'id', None)
-                    )
-                    logger.info("Sent render_session event with URL: %s", render_session_url)
-                else:
-                    # Send regular agent event
-                    payload = item.model_dump_json(exclude_none=True, by_alias=True)
-                    logger.info("Streaming event in runv3: %s", payload)
-                    yield ServerSentEvent(
-                        data=payload,
-                        event="agent_event",
-                        id=getattr(item, 'id', None)  # Use event ID if available
-                    )
+                # Drain events that are already queued into the same write so
+                # bursts cost one ASGI send instead of one per event. Each
+                # event is still its own SSE message on the wire.
+                frames = []
+                while True:
+                    if item is None:  # sentinel => done
+                        done = True
+                        break
+                    if isinstance(item, bytes):
+                        frames.append(item)
+                    elif item is not _HEARTBEAT:
+                        frames.append(encode_event(item))
+                    if not pending or len(frames) >= MAX_EVENTS_PER_WRITE:
+                        break
+                    item = pending.popleft()
+                has_room.set()
+                if frames:
+                    yield b"".join(frames)
 
             # Stream completion event
-            yield ServerSentEvent(
-                data='{"type":"stream_complete"}',
-                event="stream_complete"
-            )
+            yield _SSE_STREAM_COMPLETE
         except asyncio.CancelledError:
-            logger.warning("Client disconnected mid-stream, but agent continues running")
-            # Agent keeps running to preserve MCP session - this is the key fix!
-            pass
+            logger.warning(
+                "Client disconnected mid-stream; agent continues for up to %ss",
+                _RUNV3_DETACHED_GRACE_SECONDS,
+            )
         except Exception as e:
             logger.exception("Error in event_generator: %s", e)
-            yield ServerSentEvent(
-                data=f'{{"type":"error","error":"{str(e)}"}}',
-                event="error"
+            yield _sse_frame(
+                b"error", orjson.dumps({"type": "error", "error": str(e)})
             )
         finally:
-            if not pump_task.done():
-                pump_task.cancel()
-
-    return EventSourceResponse(event_generator())
+            heartbeat_task.cancel()
+            # Release the agent if it is waiting on a full buffer.
+            client_gone = True
+            pending.clear()
+            has_room.set()
+            detach_run()
+
+    # Frames are already SSE bytes and keep-alives come from heartbeat(), so
+    # nothing is left for EventSourceResponse (and its own pinger) to do.
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS,
+    )
 
   @app.get(
       "/apps/{app_name}/users/{user_id}/sessions/{session_id}/events/{event_id}/graph",
@@ -1078,33 +1582,32 @@ def get_fast_api_app(
     function_calls = event.get_function_calls()
     function_responses = event.get_function_responses()
     root_agent = agent_loader.load_agent(app_name)
-    dot_graph = None
     if function_calls:
-      function_call_highlights = []
-      for function_call in function_calls:
-        from_name = event.author
-        to_name = function_call.name
-        function_call_highlights.append((from_name, to_name))
-        dot_graph = await agent_graph.get_agent_graph(
-            root_agent, function_call_highlights
-        )
+      highlights = tuple(
+          (event.author, function_call.name) for function_call in function_calls
+      )
     elif function_responses:
-      function_responses_highlights = []
-      for function_response in function_responses:
-        from_name = function_response.name
-        to_name = event.author
-        function_responses_highlights.append((from_name, to_name))
-        dot_graph = await agent_graph.get_agent_graph(
-            root_agent, function_responses_highlights
-        )
-    else:
-      from_name = event.author
-      to_name = ""
-      dot_graph = await agent_graph.get_agent_graph(
-          root_agent, [(from_name, to_name)]
+      highlights = tuple(
+          (function_response.name, event.author)
+          for function_response in function_responses
       )
+    else:
+      highlights = ((event.author, ""),)
+
+    key = (app_name, highlights)
+    cached = graph_cache.get(key)
+    if cached is not None and cached[0] is root_agent:
+      graph_cache.move_to_end(key)
+      return GetEventGraphResult(dot_src=cached[1])
+
+    dot_graph = await agent_graph.get_agent_graph(root_agent, list(highlights))
     if dot_graph and isinstance(dot_graph, graphviz.Digraph):
-      return GetEventGraphResult(dot_src=dot_graph.source)
+      dot_src = dot_graph.source
+      graph_cache[key] = (root_agent, dot_src)
+      graph_cache.move_to_end(key)
+      if len(graph_cache) > _GRAPH_CACHE_SIZE:
+        graph_cache.popitem(last=False)
+      return GetEventGraphResult(dot_src=dot_src)
     else:
       return {}
 
@@ -1130,15 +1633,35 @@ def get_fast_api_app(
       return
 
     live_request_queue = LiveRequestQueue()
+    last_sent = time.monotonic()
 
     async def forward_events():
-      runner = await _get_runner_async(app_name)
+      nonlocal last_sent
+      runner = _get_cached_runner(app_name) or await _get_runner_async(
+          app_name
+      )
       async for event in runner.run_live(
           session=session, live_request_queue=live_request_queue
       ):
         await websocket.send_text(
             event.model_dump_json(exclude_none=True, by_alias=True)
         )
+        last_sent = time.monotonic()
+
+    async def ping_when_idle():
+      nonlocal last_sent
+      while True:
+        await asyncio.sleep(
+            _WS_PING_INTERVAL_SECONDS - (time.monotonic() - last_sent)
+        )
+        if time.monotonic() - last_sent < _WS_PING_INTERVAL_SECONDS:
+          continue
+        try:
+          await websocket.send_text(_WS_PING)
+        except Exception:
+          # The other tasks notice the closed socket and report it.
+          return
+        last_sent = time.monotonic()
 
     async def process_messages():
       try:
@@ -1154,6 +1677,7 @@ def get_fast_api_app(
         asyncio.create_task(forward_events()),
         asyncio.create_task(process_messages()),
     ]
+    pinger = asyncio.create_task(ping_when_idle())
     done, pending = await asyncio.wait(
         tasks, return_when=asyncio.FIRST_EXCEPTION
     )
@@ -1173,29 +1697,48 @@ def get_fast_api_app(
           reason=str(e)[:WEBSOCKET_MAX_BYTES_FOR_REASON],
       )
     finally:
+      pinger.cancel()
       for task in pending:
         task.cancel()
 
-  async def _get_runner_async(app_name: str) -> Runner:
-    """Returns the runner for the given app."""
+  def _get_cached_runner(app_name: str) -> Optional[Runner]:
+    """Returns the already built runner for the app, if it is still valid.
+
+    Lets request handlers skip awaiting `_get_runner_async` on the common
+    path.
+    """
     if app_name in _runners_to_clean:
-      _runners_to_clean.remove(app_name)
-      runner = runner_dict.pop(app_name, None)
-      await cleanup.close_runners(list([runner]))
+      return None
+    return runner_dict.get(app_name)
 
-    envs.load_dotenv_for_agent(os.path.basename(app_name), agents_dir)
-    if app_name in runner_dict:
-      return runner_dict[app_name]
-    root_agent = agent_loader.load_agent(app_name)
-    runner = Runner(
-        app_name=app_name,
-        agent=root_agent,
-        artifact_service=artifact_service,
-        session_service=session_service,
-        memory_service=memory_service,
-        credential_service=credential_service,
-    )
-    runner_dict[app_name] = runner
-    return runner
+  async def _get_runner_async(app_name: str) -> Runner:
+    """Returns the runner for the given app."""
+    # Serialize get-or-create per app, so concurrent cold requests build one
+    # runner instead of each loading the agent and leaking the extras.
+    # setdefault needs no lock of its own: there is no await around it.
+    async with runner_locks.setdefault(app_name, asyncio.Lock()):
+      if app_name in _runners_to_clean:
+        _runners_to_clean.remove(app_name)
+        runner = runner_dict.pop(app_name, None)
+        await cleanup.close_runners(list([runner]))
+        # The agent changed on disk; pick up its .env again on rebuild.
+        envs_loaded.discard(app_name)
+
+      if app_name in runner_dict:
+        return runner_dict[app_name]
+      if app_name not in envs_loaded:
+        envs.load_dotenv_for_agent(os.path.basename(app_name), agents_dir)
+        envs_loaded.add(app_name)
+      root_agent = agent_loader.load_agent(app_name)
+      runner = Runner(
+          app_name=app_name,
+          agent=root_agent,
+          artifact_service=artifact_service,
+          session_service=session_service,
+          memory_service=memory_service,
+          credential_service=credential_service,
+      )
+      runner_dict[app_name] = runner
+      return runner
 
   return app
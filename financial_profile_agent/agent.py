@@ -1,12 +1,21 @@
+import os
 from typing import Dict, Any, Optional
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.llm_agent import Agent
 from google.genai import types
 
 from tools import fi_toolset
-from financial_profile_agent.prompts import financial_profile_agent_prompt_2, financial_profile_agent_prompt_3
+from financial_profile_agent.prompts import financial_profile_agent_prompt_3
 from tools.memory_tools import memory_toolkit
-from memory.service import service as memory_service
+from tools.profile_tools import record_profile_report
+from tools.recurring_tools import capture_recurring_streams, get_recurring_streams
+from utils.llm_cache import serve_cached_response, store_response
+from memory.service import add_session_to_memory_in_background
+from utils.models import gemini
+
+# Overridable so the model can be ramped (e.g. back to gemini-2.5-pro) without a deploy.
+fp_agent_model = os.getenv('FP_AGENT_MODEL', 'gemini-2.0-flash')
+
 # spending_analyzer_agent = Agent(
 #     model='gemini-2.0-flash',
 #     name='spending_analyzer',
@@ -26,14 +35,19 @@ from memory.service import service as memory_service
 async def modify_output_after_agent(callback_context: CallbackContext) -> Optional[types.Content]:
     session = callback_context._invocation_context.session
     if len(session.events) >= 2:
-        await memory_service.add_session_to_memory(session)
+        add_session_to_memory_in_background(session)
 
 root_agent = Agent(
-    model='gemini-2.5-pro',
+    model=gemini(fp_agent_model),
     name='financial_profile_agent',
     description='A helpful agent that can analyze the user\'s financial profile',
-    instruction=financial_profile_agent_prompt_3,
-    tools=[fi_toolset, memory_toolkit]
+    # Sent verbatim as the system instruction on every turn, so Gemini can
+    # serve the prompt prefix from its context cache.
+    static_instruction=financial_profile_agent_prompt_3,
+    tools=[fi_toolset, memory_toolkit, record_profile_report, get_recurring_streams],
+    after_tool_callback=capture_recurring_streams,
+    before_model_callback=serve_cached_response,
+    after_model_callback=store_response,
 )
 
 
@@ -1,6 +1,9 @@
+import os
+
 from google.adk.agents.llm_agent import Agent
+from google.adk.tools.agent_tool import AgentTool
 
-from tools.fi_tools import financial_data_toolkit
+from tools.fi_tools import financial_data_toolkit, fetch_full_financial_snapshot
 from tools.supabase_tools import (
     create_goal,
     get_goal,
@@ -19,15 +22,28 @@ from tools.supabase_tools import (
     get_user_total_points,
     get_goal_completion_rate,
 )
-from .prompts import goals_agent_prompt
+from utils.function_tools import CachedDeclarationFunctionTool
+from utils.models import gemini
+from utils.retry import with_retries
+from .prompts import goals_agent_prompt, deep_analysis_agent_prompt
 
-root_agent = Agent(
-    model='gemini-2.5-pro',
-    name='goals_agent',
-    description='You are a helpful agent that can analyze the user\'s financial goals and provide insights and recommendations.',
-    instruction=goals_agent_prompt,
-    tools=[
-        financial_data_toolkit,
+# Goal CRUD and tool orchestration run on the fast model; only requests that
+# need multi-step reasoning are escalated to the deep one.
+goals_agent_model = os.getenv('GOALS_AGENT_MODEL', 'gemini-2.5-flash')
+deep_analysis_model = os.getenv('GOALS_DEEP_ANALYSIS_MODEL', 'gemini-2.5-pro')
+
+deep_analysis_agent = Agent(
+    model=gemini(deep_analysis_model),
+    name='deep_analysis_agent',
+    description='Performs multi-step financial analysis, e.g. trade-offs between goals or long-horizon projections.',
+    static_instruction=deep_analysis_agent_prompt,
+)
+
+# Supabase calls retry transient connection/429/503 failures, and each tool's
+# declaration is built once instead of on every model call.
+goals_tools = tuple(
+    CachedDeclarationFunctionTool(with_retries(func))
+    for func in (
         # Goals CRUD operations
         create_goal,
         get_goal,
@@ -47,5 +63,18 @@ root_agent = Agent(
         # Utility functions
         get_user_total_points,
         get_goal_completion_rate,
+    )
+)
+
+root_agent = Agent(
+    model=gemini(goals_agent_model),
+    name='goals_agent',
+    description='You are a helpful agent that can analyze the user\'s financial goals and provide insights and recommendations.',
+    static_instruction=goals_agent_prompt,
+    tools=[
+        financial_data_toolkit,
+        fetch_full_financial_snapshot,
+        AgentTool(agent=deep_analysis_agent),
+        *goals_tools,
     ]
 )
@@ -1,3 +1,5 @@
+from utils.prompts import canonical_prompt
+
 itr_process_prompt="""
 # Role and Objective
 You are an autonomous assistant that helps the user file their Income Tax Return (ITR) via a browser session. You control the browser using the provided tools to navigate the ITR portal, interact with forms, extract required information, and complete submission.
@@ -53,4 +55,6 @@ Use the following tools only as needed to perform your task:
 - Continue autonomously after successful login.
 - Only pause when input is explicitly required from the user.
 
-"""
\ No newline at end of file
+"""
+
+itr_process_prompt = canonical_prompt("itr_process_prompt", itr_process_prompt)
@@ -1,4 +1,9 @@
 import asyncio
+import contextlib
+import logging
+import os
+import weakref
+from types import MappingProxyType
 import vertexai
 from vertexai import agent_engines
 
@@ -9,51 +14,140 @@ from google.adk.memory.base_memory_service import SearchMemoryResponse
 from google.adk.sessions.session import Session
 from google.adk.events.event import Event
 
-service = VertexAiMemoryBankService(agent_engine_id="3801134842523942912")
+logger = logging.getLogger(__name__)
+
+
+class PooledVertexAiMemoryBankService(VertexAiMemoryBankService):
+    """VertexAiMemoryBankService that reuses one API client per event loop.
+
+    The base service builds a fresh client, and with it a fresh HTTP
+    connection pool, for every add/search call. Keeping a client per running
+    loop lets later calls reuse its keep-alive connections instead of paying
+    for a new TLS handshake each turn. Its async transport is bound to the
+    loop it was created on, so other loops (scripts, tests) get their own,
+    and a client is dropped together with its loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._api_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _get_api_client(self):
+        loop = asyncio.get_running_loop()
+        client = self._api_clients.get(loop)
+        if client is None:
+            client = self._api_clients[loop] = super()._get_api_client()
+        return client
+
+
+service = PooledVertexAiMemoryBankService(agent_engine_id="3801134842523942912")
+
+# Latest snapshot of each session waiting to be written, keyed by session id.
+# Turns that finish before the next flush collapse into a single write.
+_pending_sessions: dict[tuple[str, str, str], Session] = {}
+MEMORY_FLUSH_INTERVAL_SECONDS = float(os.environ.get("MEMORY_FLUSH_INTERVAL", "5"))
+_flush_task: asyncio.Task | None = None
+
+
+async def _write_pending_sessions() -> None:
+    """Writes every pending session to the memory bank, one at a time.
+
+    Writes run sequentially rather than gathered, so a large backlog never
+    holds every request and response in memory at once. A session leaves
+    `_pending_sessions` only after its write, so an interrupted flush loses
+    nothing; a newer snapshot queued during the write stays pending.
+    """
+    while _pending_sessions:
+        key, session = next(iter(_pending_sessions.items()))
+        try:
+            await service.add_session_to_memory(session)
+        except Exception:
+            logger.exception("Failed to add session %s to memory", session.id)
+        if _pending_sessions.get(key) is session:
+            del _pending_sessions[key]
+
+
+async def _flush_periodically() -> None:
+    while True:
+        await asyncio.sleep(MEMORY_FLUSH_INTERVAL_SECONDS)
+        await _write_pending_sessions()
+
+
+async def flush_pending_sessions() -> None:
+    """Stops the periodic flush and writes whatever is still pending.
+
+    Call on shutdown (e.g. from the app lifespan) so queued memory writes
+    are not dropped with the process.
+    """
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _flush_task
+        _flush_task = None
+    await _write_pending_sessions()
+
+
+def add_session_to_memory_in_background(session: Session) -> None:
+    """Queues `session` for the next batched `service.add_session_to_memory`.
+
+    Lets agent callbacks return right away instead of holding the final event
+    back for the duration of the memory write. Only the latest snapshot of a
+    session queued within one flush interval is written.
+    """
+    global _flush_task
+    _pending_sessions[(session.app_name, session.user_id, session.id)] = session
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(
+            _flush_periodically(), name="flush_pending_sessions"
+        )
+
+
+# Sample model event used by the script entry point below; read-only so it
+# can be shared across runs.
+_DEMO_EVENT = MappingProxyType({
+    "content": {
+        "parts": [
+            {
+                "text": "Hi, I am Namish"
+            }
+        ],
+        "role": "user"
+    },
+    "usageMetadata": {
+        "candidatesTokenCount": 138,
+        "candidatesTokensDetails": [
+            {
+                "modality": "TEXT",
+                "tokenCount": 138
+            }
+        ],
+        "promptTokenCount": 18928,
+        "promptTokensDetails": [
+            {
+                "modality": "TEXT",
+                "tokenCount": 18928
+            }
+        ],
+        "totalTokenCount": 19066,
+        "trafficType": "ON_DEMAND"
+    },
+    "invocationId": "e-0b9404c6-2797-4942-b98f-241e158ef405",
+    "author": "financial_assistant",
+    "actions": {
+        "stateDelta": {},
+        "artifactDelta": {},
+        "requestedAuthConfigs": {}
+    },
+    "id": "d5322041-609f-46b3-9e0e-09e2694c8101",
+    "timestamp": 1753290329.133947
+})
 
 
 async def main():
     # agent_engine = agent_engines.create()
     # print(f"Created Agent Engine: {agent_engine.resource_name}")
 
-    event ={
-        "content": {
-            "parts": [
-                {
-                    "text": "Hi, I am Namish"
-                }
-            ],
-            "role": "user"
-        },
-        "usageMetadata": {
-            "candidatesTokenCount": 138,
-            "candidatesTokensDetails": [
-                {
-                    "modality": "TEXT",
-                    "tokenCount": 138
-                }
-            ],
-            "promptTokenCount": 18928,
-            "promptTokensDetails": [
-                {
-                    "modality": "TEXT",
-                    "tokenCount": 18928
-                }
-            ],
-            "totalTokenCount": 19066,
-            "trafficType": "ON_DEMAND"
-        },
-        "invocationId": "e-0b9404c6-2797-4942-b98f-241e158ef405",
-        "author": "financial_assistant",
-        "actions": {
-            "stateDelta": {},
-            "artifactDelta": {},
-            "requestedAuthConfigs": {}
-        },
-        "id": "d5322041-609f-46b3-9e0e-09e2694c8101",
-        "timestamp": 1753290329.133947
-    }
-
     # mock session
     session = Session(
         id="123",
@@ -61,15 +155,45 @@ async def main():
         user_id="user123",
         state={},
         events=[
-            Event(**event)
+            Event(**_DEMO_EVENT)
         ]
     )
     # await service.add_session_to_memory(session)
     response: SearchMemoryResponse = await service.search_memory(app_name="simple_agent", user_id="c5a8df11-1dfb-484b-a169-32a83d0b927a", query="Is user in debt?")
     print(response)
 
+_runner: asyncio.Runner | None = None
+
+
+def get_runner() -> asyncio.Runner:
+    """Returns a shared asyncio.Runner, on uvloop when it is installed.
+
+    Reusing the runner keeps one event loop across repeated `run` calls,
+    e.g. several scripted memory queries, instead of building one per call.
+    """
+    global _runner
+    if _runner is None:
+        try:
+            import uvloop
+            loop_factory = uvloop.new_event_loop
+        except ImportError:  # e.g. Windows, where uvloop is unavailable
+            loop_factory = None
+        _runner = asyncio.Runner(loop_factory=loop_factory)
+    return _runner
+
+
+def close_runner() -> None:
+    """Closes the shared runner; the next `get_runner()` builds a new one."""
+    global _runner
+    if _runner is not None:
+        _runner.close()
+        _runner = None
+
+
 if __name__ == "__main__":
-    import os
     from dotenv import load_dotenv
     _ = load_dotenv()
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        get_runner().run(main())
+    finally:
+        close_runner()
\ No newline at end of file
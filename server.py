@@ -1,78 +1,161 @@
+import asyncio
+import contextlib
+import functools
 import google.auth
-import json
+import os
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from fast_api_custom import get_fast_api_app
+from memory.service import flush_pending_sessions
 from google.cloud import logging as google_cloud_logging
-from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider, export
+from google.cloud.logging.handlers import StructuredLogHandler
+from pydantic import TypeAdapter
 
+from utils.compression import StreamingAwareGZipMiddleware
 from utils.gcs import create_bucket_if_not_exists
-from utils.tracing import CloudTraceLoggingSpanExporter
+from utils.observability import init_tracing
 from utils.typing import Feedback, FIRequest
 from settings import settings
 # from phoenix.otel import register
 
 import logging  # Import the logging module to configure debug logging
 
-# Configure basic logging to display debug output
-logging.basicConfig(level=logging.INFO)
+# Log records go to stdout as structured JSON, which the platform's logging
+# agent ingests; no Logging API call is made per record.
+root_logger = logging.getLogger()
+root_logger.addHandler(StructuredLogHandler())
+root_logger.setLevel(logging.INFO)
 
-_, project_id = google.auth.default()
 logging_client = google_cloud_logging.Client()
-# Enable Cloud Logging to capture messages at DEBUG level
-logging_client.setup_logging(log_level=logging.INFO)
 logger = logging_client.logger(__name__)
 
 
-# Create GCS bucket if needed
-if settings.google_cloud_storage_bucket:
-    create_bucket_if_not_exists(
-        bucket_name=settings.google_cloud_storage_bucket, 
-        project=project_id, 
-        location=settings.google_cloud_location
-    )
+@functools.lru_cache(maxsize=1)
+def _get_project_id() -> str | None:
+    """Resolve the default credentials' project once, on first use."""
+    _, project_id = google.auth.default()
+    return project_id
 
-provider = TracerProvider()
-processor = export.BatchSpanProcessor(CloudTraceLoggingSpanExporter())
-provider.add_span_processor(processor)
-trace.set_tracer_provider(provider)
 
-import os
 AGENT_DIR = os.path.dirname(os.path.abspath(__file__))
 
-app: FastAPI = get_fast_api_app(
-    agents_dir=AGENT_DIR,
-    web=True,
-    artifact_service_uri=settings.google_cloud_storage_bucket,
-    allow_origins=settings.cors_origins,
-    session_service_uri=settings.supabase_db_conn_string,
-    memory_service_uri=settings.memory_service_uri,
-    trace_to_cloud=settings.trace_to_cloud,
-)
-app.title = settings.app_title
-app.description = settings.app_description
+# Built once; reused to serialize every /feedback payload.
+_FB_ADAPTER = TypeAdapter(Feedback)
+
+# Feedback entries waiting to be written to Cloud Logging. When full, new
+# entries are dropped rather than making /feedback wait on the logging API.
+FEEDBACK_QUEUE_SIZE = 1024
+
+
+async def _drain_feedback(queue: asyncio.Queue) -> None:
+    """Writes queued feedback to Cloud Logging, off the request path."""
+    while True:
+        item = await queue.get()
+        try:
+            await asyncio.to_thread(logger.log_struct, item, severity="INFO")
+        except Exception:
+            logging.exception("Failed to log feedback")
+        finally:
+            queue.task_done()
+
+
+@contextlib.asynccontextmanager
+async def feedback_lifespan(app: FastAPI):
+    app.state.fb_queue = asyncio.Queue(maxsize=FEEDBACK_QUEUE_SIZE)
+    drain_task = asyncio.create_task(_drain_feedback(app.state.fb_queue))
+    try:
+        yield
+    finally:
+        # Give queued feedback a moment to flush before stopping the consumer.
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(app.state.fb_queue.join(), timeout=5)
+        drain_task.cancel()
+        # Write the sessions still waiting for the next memory-bank flush.
+        try:
+            await asyncio.wait_for(flush_pending_sessions(), timeout=20)
+        except asyncio.TimeoutError:
+            logging.warning("Timed out flushing pending memory writes")
+
+def create_app() -> FastAPI:
+    """Build the ADK app with its session DB pool, tracing and extra routes."""
+    # Create GCS bucket if needed; the call is idempotent.
+    if settings.google_cloud_storage_bucket:
+        create_bucket_if_not_exists(
+            bucket_name=settings.google_cloud_storage_bucket,
+            project=_get_project_id(),
+            location=settings.google_cloud_location
+        )
+
+    init_tracing(settings.trace_sample_ratio, settings.trace_to_cloud)
+
+    app = get_fast_api_app(
+        agents_dir=AGENT_DIR,
+        web=True,
+        artifact_service_uri=settings.gcs_bucket_uri,
+        allow_origins=settings.cors_origins,
+        session_service_uri=settings.supabase_db_conn_string,
+        memory_service_uri=settings.memory_service_uri,
+        # Cloud export is installed by init_tracing above; a second exporter
+        # here would send every span to Cloud Trace twice.
+        trace_to_cloud=False,
+        lifespan=feedback_lifespan,
+    )
+    app.title = settings.app_title
+    app.description = settings.app_description
+    # JSON responses are gzipped; event streams and NDJSON are sent as-is.
+    app.add_middleware(
+        StreamingAwareGZipMiddleware, minimum_size=1024, compresslevel=5
+    )
 
+    @app.post("/feedback")
+    async def collect_feedback(feedback: Feedback) -> dict[str, str]:
+        """Collect and log feedback.
 
-@app.post("/feedback")
-def collect_feedback(feedback: Feedback) -> dict[str, str]:
-    """Collect and log feedback.
+        The entry is queued and written to Cloud Logging in the background.
 
-    Args:
-        feedback: The feedback data to log
+        Args:
+            feedback: The feedback data to log
 
-    Returns:
-        Success message
-    """
-    logger.log_struct(feedback.model_dump(), severity="INFO")
-    return {"status": "success"}
+        Returns:
+            Success message
+        """
+        try:
+            app.state.fb_queue.put_nowait(
+                _FB_ADAPTER.dump_python(feedback, mode="json")
+            )
+        except asyncio.QueueFull:
+            logging.warning("Feedback queue full, dropping feedback")
+        return {"status": "success"}
 
-@app.get("/ping")
-def ping():
-    return {"status": "pong"}
+    @app.get("/ping")
+    def ping():
+        return {"status": "pong"}
+
+    return app
+
+
+# With several workers, `python server.py` only supervises: each worker
+# imports "server:app" and builds its own app, so the parent skips it.
+if __name__ != "__main__" or settings.workers == 1:
+    app: FastAPI = create_app()
 
 
 # Main execution
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=settings.server_host, port=settings.server_port)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:  # e.g. Windows, where uvloop is unavailable
+        loop = "asyncio"
+    # Worker processes import the app themselves, so they need an import
+    # string; a single worker serves this already-built app directly.
+    uvicorn.run(
+        "server:app" if settings.workers > 1 else app,
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=settings.workers,
+        loop=loop,
+        http="httptools",
+        log_level="info",
+    )
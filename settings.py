@@ -5,6 +5,7 @@ This module provides a single source of truth for all application settings,
 using Pydantic BaseSettings for environment variable management and validation.
 """
 
+from functools import cached_property, lru_cache
 from typing import Optional, List
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -16,6 +17,7 @@ class Settings(BaseSettings):
     # Server Configuration
     server_host: str = Field(default="0.0.0.0", description="Server host address")
     server_port: int = Field(default=8000, description="Server port")
+    workers: int = Field(default=1, ge=1, description="Number of uvicorn worker processes")
     
     # Application Configuration
     app_title: str = Field(default="artha", description="FastAPI application title")
@@ -33,6 +35,7 @@ class Settings(BaseSettings):
     
     # Tracing Configuration
     trace_to_cloud: bool = Field(default=True, description="Enable cloud tracing")
+    trace_sample_ratio: float = Field(default=0.1, ge=0.0, le=1.0, description="Fraction of traces exported to Cloud Trace")
     debug_mode: bool = Field(default=False, description="Enable debug mode")
 
     # Memory Configuration
@@ -45,14 +48,14 @@ class Settings(BaseSettings):
         case_sensitive = False
         extra = "allow"  # Allow extra fields from environment
     
-    @property
+    @cached_property
     def cors_origins(self) -> Optional[List[str]]:
         """Parse CORS origins from comma-separated string."""
         if self.allow_origins:
             return [origin.strip() for origin in self.allow_origins.split(",") if origin.strip()]
         return None
     
-    @property
+    @cached_property
     def gcs_bucket_uri(self) -> Optional[str]:
         """Get the GCS bucket URI for artifact storage."""
         if self.google_cloud_storage_bucket:
@@ -62,5 +65,11 @@ class Settings(BaseSettings):
         return None
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment and .env once."""
+    return Settings()
+
+
 # Global settings instance
-settings = Settings() 
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
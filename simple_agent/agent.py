@@ -1,4 +1,3 @@
-import json
 from typing import Optional
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.agents.llm_agent import LlmAgent
@@ -6,12 +5,16 @@ from google.adk.sessions.session import Session
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 
-from memory.service import service as memory_service
+from memory.service import add_session_to_memory_in_background
+from utils.models import gemini
 
-import json
+import orjson
 
 def get_state(tool_context: ToolContext):
-    msg = json.dumps(tool_context.state.to_dict(), indent=4)
+    msg = orjson.dumps(
+        tool_context.state.to_dict(),
+        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+    ).decode()
     
     print(msg)
     return msg
@@ -19,16 +22,15 @@ def get_state(tool_context: ToolContext):
 
 async def modify_output_after_agent(callback_context: CallbackContext) -> Optional[types.Content]:
     session: Session = callback_context._invocation_context.session
-    # print(json.dumps(session, indent=4))
     if len(session.events) >= 2:
         print("*"*40)
         print("Adding session to memory")
         print("*"*40)
-        await memory_service.add_session_to_memory(session)
+        add_session_to_memory_in_background(session)
 
 # Clean agent definition for deployment with MCP session persistence
 root_agent = LlmAgent(
-    model='gemini-2.0-flash',
+    model=gemini('gemini-2.0-flash'),
     name='financial_assistant',
     description='A helpful financial assistant that can access Fi Money data',
     instruction="""call the tools as requested by the user""",
@@ -2,21 +2,24 @@ from google.adk.agents.llm_agent import Agent
 
 from tools.aikar_tools import (
     calculate_income_tax,
+    calculate_income_tax_batch,
     calculate_capital_gains_tax,
     compare_tax_regimes
 )
 from tools.fi_tools import financial_data_toolkit
+from utils.models import gemini
 from .prompts import tax_calculator_agent_prompt
 
 root_agent = Agent(
-    model='gemini-2.5-pro',
+    model=gemini('gemini-2.5-pro'),
     name='tax_calculator_agent',
     description='You are a helpful agent that can calculate the tax of the user\'s income.',
-    instruction=tax_calculator_agent_prompt,
+    static_instruction=tax_calculator_agent_prompt,
     tools=[
         financial_data_toolkit,
         # Tax calculation functions
         calculate_income_tax,
+        calculate_income_tax_batch,
         calculate_capital_gains_tax,
         compare_tax_regimes,
     ]
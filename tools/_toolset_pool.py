@@ -0,0 +1,47 @@
+from typing import Any, Hashable
+
+from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
+
+# One toolset, and so one MCP subprocess or HTTP session, per distinct server.
+# Lives in its own module so it survives re-imports of the tool modules.
+_TOOLSET_POOL: dict[Hashable, MCPToolset] = {}
+
+
+def _params_key(connection_params: Any, toolset_kwargs: dict[str, Any]) -> Hashable:
+    """Identifies an MCP server by how it is launched or reached."""
+    server = getattr(connection_params, "server_params", None)
+    if server is not None:
+        target = (
+            server.command,
+            tuple(server.args),
+            frozenset((server.env or {}).items()),
+        )
+    else:
+        target = (
+            connection_params.url,
+            frozenset((connection_params.headers or {}).items()),
+            getattr(connection_params, "httpx_client_factory", None),
+        )
+    return (
+        type(connection_params).__name__,
+        target,
+        getattr(connection_params, "timeout", None),
+        frozenset(toolset_kwargs.items()),
+    )
+
+
+def get_toolset(connection_params: Any, **toolset_kwargs: Any) -> MCPToolset:
+    """Returns the shared MCPToolset for `connection_params`, creating it once.
+
+    Args:
+        connection_params: Stdio or HTTP connection params for the MCP server.
+        **toolset_kwargs: Further MCPToolset arguments, e.g. `errlog`; they are
+            part of the key, so differently configured toolsets stay separate.
+    """
+    key = _params_key(connection_params, toolset_kwargs)
+    toolset = _TOOLSET_POOL.get(key)
+    if toolset is None:
+        toolset = _TOOLSET_POOL[key] = MCPToolset(
+            connection_params=connection_params, **toolset_kwargs
+        )
+    return toolset
@@ -1,6 +1,10 @@
+import functools
 import logging
-from typing import Dict, Any
+import os
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 
+import numpy as np
 from aikar import IncomeTaxCalculator, CapitalGainsCalculator
 from google.adk.tools import ToolContext
 
@@ -8,6 +12,217 @@ from google.adk.tools import ToolContext
 logger = logging.getLogger(__name__)
 
 
+# Income tax engine: "table" evaluates the precomputed slab tables below;
+# "aikar" calls aikar's IncomeTaxCalculator instead.
+TAX_ENGINE = os.getenv("TAX_ENGINE", "table")
+
+# FY 2025-26 slabs as (upper limit, rate). The new regime is the same for all
+# ages; the old regime raises the basic exemption for seniors.
+_NEW_REGIME_SLABS = [
+    (400000, 0.00),
+    (800000, 0.05),
+    (1200000, 0.10),
+    (1600000, 0.15),
+    (2000000, 0.20),
+    (2400000, 0.25),
+    (float("inf"), 0.30)
+]
+_OLD_REGIME_SLABS = {
+    "below_60": [(250000, 0.0), (500000, 0.05), (1000000, 0.2), (float("inf"), 0.3)],
+    "60_to_79": [(300000, 0.0), (500000, 0.05), (1000000, 0.2), (float("inf"), 0.3)],
+    "80_plus": [(500000, 0.0), (1000000, 0.2), (float("inf"), 0.3)],
+}
+_STANDARD_DEDUCTION = {"old": 50000.0, "new": 75000.0}
+_CESS_RATE = 0.04
+# Section 87A: taxable income up to this limit pays no tax.
+_REBATE_LIMIT = {"old": 500000, "new": 1200000}
+# New regime marginal relief: just above the rebate limit, tax never exceeds
+# the income earned above the limit.
+_MARGINAL_RELIEF_LIMIT = 1275000
+_MAX_BATCH_INCOMES = 1000
+_DEDUCTION_CAPS = {
+    "section_80c": 150000.0,
+    "section_80ccd2": 200000.0,
+    "home_loan_interest": 200000.0,
+}
+
+
+def _resolve_tax_method(calculator_cls) -> Optional[str]:
+    """Finds the name of an aikar calculator's tax method, once at import."""
+    for name in ('calculate_tax', 'calculate', 'get_tax'):
+        if hasattr(calculator_cls, name):
+            return name
+    return None
+
+
+_INCOME_TAX_METHOD = _resolve_tax_method(IncomeTaxCalculator)
+_CAPITAL_GAINS_METHOD = _resolve_tax_method(CapitalGainsCalculator)
+
+
+def _call_tax_method(calculator, method_name: Optional[str]) -> Dict[str, Any]:
+    if method_name is None:
+        raise AttributeError(f"{type(calculator).__name__} has no tax calculation method")
+    return getattr(calculator, method_name)()
+
+
+def _slab_table(slabs):
+    """Turns (upper limit, rate) slabs into rows of (cutoff, rate, base).
+
+    Within a row, tax = base + rate * (income - cutoff), where base is the
+    tax due on all income below the cutoff.
+    """
+    rows = []
+    cutoff, base = 0.0, 0.0
+    for upper, rate in slabs:
+        rows.append((cutoff, rate, base))
+        base += (upper - cutoff) * rate
+        cutoff = upper
+    return np.array(rows)
+
+
+# (regime, age band) -> table of (cutoff, rate, base) rows, built once.
+SLAB_TABLE = {
+    **{("old", band): _slab_table(slabs) for band, slabs in _OLD_REGIME_SLABS.items()},
+    **{("new", band): _slab_table(_NEW_REGIME_SLABS) for band in _OLD_REGIME_SLABS},
+}
+
+
+def _age_band(age: int) -> str:
+    if age >= 80:
+        return "80_plus"
+    if age >= 60:
+        return "60_to_79"
+    return "below_60"
+
+
+def _applied_deductions(
+        regime: str,
+        deductions_80c: float,
+        deductions_hra: float,
+        deductions_80ccd2: float,
+        deductions_home_loan: float
+) -> Dict[str, float]:
+    """Returns each deduction as allowed under `regime`, after statutory caps."""
+    if regime not in _STANDARD_DEDUCTION:
+        raise ValueError("Invalid regime. Please choose 'new' or 'old'.")
+    claimed = {
+        "section_80c": deductions_80c,
+        "hra": deductions_hra,
+        "section_80ccd2": deductions_80ccd2,
+        "home_loan_interest": deductions_home_loan,
+    }
+    if any(amount < 0 for amount in claimed.values()):
+        raise ValueError("Deductions must be positive numbers.")
+    applied = {}
+    for name, amount in claimed.items():
+        if regime == "new" and name != "section_80ccd2":
+            amount = 0.0
+        cap = _DEDUCTION_CAPS.get(name)
+        applied[name] = min(amount, cap) if cap is not None else amount
+    return applied
+
+
+def _slab_tax(taxable_income: np.ndarray, age: int, regime: str) -> np.ndarray:
+    """Slab tax after the 87A rebate and marginal relief, before cess.
+
+    Works element-wise, so a whole array of taxable incomes is evaluated with
+    one searchsorted and a few vector operations.
+    """
+    table = SLAB_TABLE[(regime, _age_band(age))]
+    idx = np.searchsorted(table[:, 0], taxable_income, side="right") - 1
+    tax = table[idx, 2] + table[idx, 1] * (taxable_income - table[idx, 0])
+    rebate_limit = _REBATE_LIMIT[regime]
+    tax = np.where(taxable_income <= rebate_limit, 0.0, tax)
+    if regime == "new":
+        relief = (taxable_income > rebate_limit) & (taxable_income <= _MARGINAL_RELIEF_LIMIT)
+        tax = np.where(relief, np.minimum(tax, taxable_income - rebate_limit), tax)
+    return tax
+
+
+@functools.lru_cache(maxsize=4096)
+def _compute_tax(income: int, age: int, regime: str, total_deductions: int) -> Tuple[float, float]:
+    """Evaluates the slab table for one taxpayer.
+
+    Args take whole rupees so that repeated queries share cache entries.
+
+    Returns:
+        (taxable_income, total tax payable including cess, rounded to the rupee).
+    """
+    if income < 0:
+        raise ValueError("Income cannot be negative.")
+    if not 0 <= age <= 100:
+        raise ValueError("Invalid age. Age should be between 0 and 100.")
+    taxable_income = max(0.0, income - total_deductions - _STANDARD_DEDUCTION[regime])
+    tax = _slab_tax(np.float64(taxable_income), age, regime)
+    return taxable_income, float(np.round(tax * (1 + _CESS_RATE)))
+
+
+def _aikar_income_tax(
+        income: float,
+        age: int,
+        regime: str,
+        deductions_80c: float,
+        deductions_hra: float,
+        deductions_80ccd2: float,
+        deductions_home_loan: float
+) -> Tuple[float, float]:
+    """Computes (taxable_income, total tax) with aikar's IncomeTaxCalculator."""
+    calculator = IncomeTaxCalculator(
+        income=income,
+        age=age,
+        regime=regime,
+        deductions={
+            '80C': deductions_80c,
+            'HRA': deductions_hra,
+            '80CCD2': deductions_80ccd2,
+            'Home Loan': deductions_home_loan
+        }
+    )
+    response = _call_tax_method(calculator, _INCOME_TAX_METHOD)
+    return max(0.0, float(response["Taxable Income"])), float(response["Total Tax Payable"])
+
+
+def _income_tax_result(
+        income: float,
+        age: int,
+        regime: str,
+        deductions_80c: float,
+        deductions_hra: float,
+        deductions_80ccd2: float,
+        deductions_home_loan: float
+) -> Dict[str, Any]:
+    """Builds the `calculate_income_tax` result for one regime, without logging."""
+    deductions = _applied_deductions(
+        regime, deductions_80c, deductions_hra, deductions_80ccd2, deductions_home_loan
+    )
+    total_deductions = sum(deductions.values())
+
+    if TAX_ENGINE == "aikar":
+        taxable_income, actual_tax = _aikar_income_tax(
+            income, age, regime, deductions_80c, deductions_hra,
+            deductions_80ccd2, deductions_home_loan
+        )
+    else:
+        taxable_income, actual_tax = _compute_tax(
+            round(income), age, regime, round(total_deductions)
+        )
+
+    return {
+        "total_tax": actual_tax,
+        "taxable_income": taxable_income,
+        "gross_income": income,
+        "regime_used": regime,
+        "age": age,
+        "deductions_applied": {
+            **deductions,
+            "standard_deduction": _STANDARD_DEDUCTION[regime],
+            "total_deductions": total_deductions
+        },
+        "tax_rate_applicable": "Based on Indian tax slabs",
+        "calculation_status": "success"
+    }
+
+
 def calculate_income_tax(
         tool_context: ToolContext,
         income: float,
@@ -19,10 +234,11 @@ def calculate_income_tax(
         deductions_home_loan: float = 0.0
 ) -> Dict[str, Any]:
     """
-    Calculate income tax for the given income and deductions using aikar library.
+    Calculate income tax for the given income and deductions.
     
     This tool calculates income tax based on Indian tax slabs for both old and new tax regimes.
-    It considers various deductions like 80C, HRA, 80CCD2, and home loan interest.
+    It considers various deductions like 80C, HRA, 80CCD2, and home loan interest. The old
+    regime allows all of them; the new regime only allows 80CCD2.
     
     Args:
         tool_context (ToolContext): The tool context containing user state and session info.
@@ -36,8 +252,8 @@ def calculate_income_tax(
     
     Returns:
         Dict[str, Any]: Dictionary containing tax calculation details including:
-                       - total_tax: Total tax amount
-                       - taxable_income: Income after deductions
+                       - total_tax: Total tax amount, including 4% cess
+                       - taxable_income: Income after deductions and the standard deduction
                        - regime_used: Tax regime applied
                        - deductions_applied: Summary of deductions
     
@@ -55,93 +271,119 @@ def calculate_income_tax(
         >>> print(f"Total tax: ₹{tax_result['total_tax']:,.2f}")
     """
     try:
-        # Prepare deductions dictionary for aikar library
-        deductions = {
-            '80C': deductions_80c,
-            'HRA': deductions_hra,
-            '80CCD2': deductions_80ccd2,
-            'Home Loan': deductions_home_loan
-        }
-
-        # Create IncomeTaxCalculator instance
-        income_tax_calculator = IncomeTaxCalculator(
-            income=income,
-            age=age,
-            regime=regime,
-            deductions=deductions
+        result = _income_tax_result(
+            income, age, regime, deductions_80c, deductions_hra,
+            deductions_80ccd2, deductions_home_loan
         )
+        actual_tax = result["total_tax"]
 
-        # Calculate tax (assuming the calculator has a calculate method or similar)
-        # Note: The exact method name may vary based on the actual aikar library implementation
-        try:
-            # Try common method names for tax calculation
-            if hasattr(income_tax_calculator, 'calculate_tax'):
-                tax_amount = income_tax_calculator.calculate_tax()
-            elif hasattr(income_tax_calculator, 'calculate'):
-                tax_amount = income_tax_calculator.calculate()
-            elif hasattr(income_tax_calculator, 'get_tax'):
-                tax_amount = income_tax_calculator.get_tax()
-            else:
-                # If no standard method found, try to access tax attribute
-                tax_amount = getattr(income_tax_calculator, 'tax', 0)
-        except Exception as calc_error:
-            logger.exception(f"Error in tax calculation method: {str(calc_error)}")
-            # Fallback: return basic calculation info
-            tax_amount = 0
-
-        # Handle tax_amount - it might be a dictionary or a number
-        if isinstance(tax_amount, dict):
-            # If it's a dictionary, try to extract the tax value
-            actual_tax = tax_amount.get('tax', tax_amount.get('total_tax', tax_amount.get('income_tax', 0)))
-        else:
-            # If it's already a number, use it directly
-            actual_tax = tax_amount if tax_amount is not None else 0
+        logger.info(f"Income tax calculated: ₹{actual_tax:,.2f} for income ₹{income:,.2f} using {regime} regime")
+        return result
+
+    except Exception as e:
+        logger.exception(f"Error calculating income tax: {str(e)}")
+        return {
+            "total_tax": 0,
+            "taxable_income": 0,
+            "gross_income": income,
+            "regime_used": regime,
+            "age": age,
+            "deductions_applied": {},
+            "error": str(e),
+            "calculation_status": "failed"
+        }
 
-        # Ensure actual_tax is a number
-        try:
-            actual_tax = float(actual_tax)
-        except (ValueError, TypeError):
-            actual_tax = 0
 
-        # Calculate taxable income after deductions
+def calculate_income_tax_batch(
+        tool_context: ToolContext,
+        incomes: List[float],
+        age: int,
+        regime: str = "new",
+        deductions_80c: float = 0.0,
+        deductions_hra: float = 0.0,
+        deductions_80ccd2: float = 0.0,
+        deductions_home_loan: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Calculate income tax for many incomes at once under the same regime and deductions.
+    
+    Use this for what-if sweeps, e.g. the tax on salaries from ₹5,00,000 to ₹50,00,000
+    in ₹1,00,000 steps, instead of calling calculate_income_tax once per income.
+    
+    Args:
+        tool_context (ToolContext): The tool context containing user state and session info.
+        incomes (List[float]): Annual incomes in INR, at most 1000. Required.
+        age (int): Age of the taxpayer. Required for senior citizen benefits.
+        regime (str, optional): Tax regime - 'old' or 'new'. Defaults to 'new'.
+        deductions_80c (float, optional): Deductions under Section 80C. Defaults to 0.0.
+        deductions_hra (float, optional): HRA deductions. Defaults to 0.0.
+        deductions_80ccd2 (float, optional): NPS employer contribution. Defaults to 0.0.
+        deductions_home_loan (float, optional): Home loan interest. Defaults to 0.0.
+    
+    Returns:
+        Dict[str, Any]: Dictionary containing:
+                       - results: One {income, taxable_income, total_tax} per income, in order
+                       - regime_used: Tax regime applied
+                       - deductions_applied: Summary of deductions
+    """
+    try:
+        if len(incomes) > _MAX_BATCH_INCOMES:
+            raise ValueError(f"At most {_MAX_BATCH_INCOMES} incomes can be calculated at once.")
+        if not 0 <= age <= 100:
+            raise ValueError("Invalid age. Age should be between 0 and 100.")
+        deductions = _applied_deductions(
+            regime, deductions_80c, deductions_hra, deductions_80ccd2, deductions_home_loan
+        )
         total_deductions = sum(deductions.values())
-        taxable_income = max(0, income - total_deductions)
+
+        gross = np.asarray(incomes, dtype=np.float64)
+        if (gross < 0).any():
+            raise ValueError("Income cannot be negative.")
+        taxable = np.maximum(
+            0.0, np.round(gross) - round(total_deductions) - _STANDARD_DEDUCTION[regime]
+        )
+        taxes = np.round(_slab_tax(taxable, age, regime) * (1 + _CESS_RATE))
 
         result = {
-            "total_tax": actual_tax,
-            "taxable_income": taxable_income,
-            "gross_income": income,
+            "results": [
+                {"income": income, "taxable_income": taxable_income, "total_tax": tax}
+                for income, taxable_income, tax in zip(incomes, taxable.tolist(), taxes.tolist())
+            ],
             "regime_used": regime,
             "age": age,
             "deductions_applied": {
-                "section_80c": deductions_80c,
-                "hra": deductions_hra,
-                "section_80ccd2": deductions_80ccd2,
-                "home_loan_interest": deductions_home_loan,
+                **deductions,
+                "standard_deduction": _STANDARD_DEDUCTION[regime],
                 "total_deductions": total_deductions
             },
-            "tax_rate_applicable": "Based on Indian tax slabs",
-            "calculation_status": "success",
-            "raw_calculator_response": tax_amount  # Include raw response for debugging
+            "calculation_status": "success"
         }
 
-        logger.info(f"Income tax calculated: ₹{actual_tax:,.2f} for income ₹{income:,.2f} using {regime} regime")
+        logger.info(f"Income tax calculated for {len(incomes)} incomes using {regime} regime")
         return result
 
     except Exception as e:
-        logger.exception(f"Error calculating income tax: {str(e)}")
+        logger.exception(f"Error calculating income tax batch: {str(e)}")
         return {
-            "total_tax": 0,
-            "taxable_income": 0,
-            "gross_income": income,
+            "results": [],
             "regime_used": regime,
             "age": age,
-            "deductions_applied": {},
             "error": str(e),
             "calculation_status": "failed"
         }
 
 
+# Holding period in days beyond which a gain is long term, per asset type.
+_LTCG_DAYS = {'equity': 365, 'debt': 1095, 'gold': 1095}
+_DEFAULT_LTCG_DAYS = 730
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_ddmmyyyy(value: str) -> int:
+    """Parses a DD/MM/YYYY date into its proleptic Gregorian ordinal."""
+    return datetime.strptime(value, '%d/%m/%Y').toordinal()
+
+
 def calculate_capital_gains_tax(
         tool_context: ToolContext,
         asset_type: str,
@@ -192,35 +434,17 @@ def calculate_capital_gains_tax(
 
         # Calculate capital gains tax
         try:
-            # Try common method names for capital gains tax calculation
-            if hasattr(capital_gains_calculator, 'calculate_tax'):
-                cg_tax = capital_gains_calculator.calculate_tax()
-            elif hasattr(capital_gains_calculator, 'calculate'):
-                cg_tax = capital_gains_calculator.calculate()
-            elif hasattr(capital_gains_calculator, 'get_tax'):
-                cg_tax = capital_gains_calculator.get_tax()
-            else:
-                # If no standard method found, try to access tax attribute
-                cg_tax = getattr(capital_gains_calculator, 'tax', 0)
+            cg_response = _call_tax_method(capital_gains_calculator, _CAPITAL_GAINS_METHOD)
+            cg_tax = float(cg_response["Tax Payable"])
         except Exception as calc_error:
             logger.error(f"Error in capital gains calculation method: {str(calc_error)}")
             cg_tax = 0
 
         # Determine holding period and gain type (basic logic)
-        from datetime import datetime
         try:
-            # Try to parse dates to determine holding period
-            buy_dt = datetime.strptime(buy_date, '%d/%m/%Y')
-            sell_dt = datetime.strptime(sell_date, '%d/%m/%Y')
-            holding_days = (sell_dt - buy_dt).days
-
-            # Determine gain type based on asset type and holding period
-            if asset_type.lower() == 'equity':
-                gain_type = 'Long Term' if holding_days > 365 else 'Short Term'
-            elif asset_type.lower() in ['debt', 'gold']:
-                gain_type = 'Long Term' if holding_days > 1095 else 'Short Term'  # 3 years
-            else:
-                gain_type = 'Long Term' if holding_days > 730 else 'Short Term'  # 2 years
+            holding_days = _parse_ddmmyyyy(sell_date) - _parse_ddmmyyyy(buy_date)
+            threshold = _LTCG_DAYS.get(asset_type.lower(), _DEFAULT_LTCG_DAYS)
+            gain_type = 'Long Term' if holding_days > threshold else 'Short Term'
 
         except ValueError:
             # If date parsing fails, use default values
@@ -300,28 +524,13 @@ def compare_tax_regimes(
         >>> print(f"Savings: ₹{comparison['savings_amount']:,.2f}")
     """
     try:
-        # Calculate tax under old regime
-        old_regime_result = calculate_income_tax(
-            tool_context=tool_context,
-            income=income,
-            age=age,
-            regime='old',
-            deductions_80c=deductions_80c,
-            deductions_hra=deductions_hra,
-            deductions_80ccd2=deductions_80ccd2,
-            deductions_home_loan=deductions_home_loan
-        )
-
-        # Calculate tax under new regime
-        new_regime_result = calculate_income_tax(
-            tool_context=tool_context,
-            income=income,
-            age=age,
-            regime='new',
-            deductions_80c=deductions_80c,
-            deductions_hra=deductions_hra,
-            deductions_80ccd2=deductions_80ccd2,
-            deductions_home_loan=deductions_home_loan
+        # Both regimes share the inputs; each is a single cached table lookup.
+        old_regime_result, new_regime_result = (
+            _income_tax_result(
+                income, age, regime, deductions_80c, deductions_hra,
+                deductions_80ccd2, deductions_home_loan
+            )
+            for regime in ('old', 'new')
         )
 
         old_tax = old_regime_result.get('total_tax', 0)
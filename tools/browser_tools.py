@@ -1,5 +1,5 @@
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
 from google.adk.tools.mcp_tool.mcp_session_manager import StdioServerParameters, StdioConnectionParams
+from tools._toolset_pool import get_toolset
 
 import os
 
@@ -21,6 +21,4 @@ connection_params = StdioConnectionParams(
     timeout=60.0*30.0,
 )
 
-browser_automation_toolkit = MCPToolset(
-            connection_params=connection_params,
-        )
\ No newline at end of file
+browser_automation_toolkit = get_toolset(connection_params)
\ No newline at end of file
@@ -1,18 +1,87 @@
+from google.adk.tools import ToolContext
 from google.adk.tools.mcp_tool.mcp_session_manager import StreamableHTTPConnectionParams
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
 
+import asyncio
 import os
+import socket
+from typing import Any, Dict
+
+import httpx
+
+from tools._toolset_pool import get_toolset
 
 fi_mcp_url = os.getenv('FI_MCP_URL')
 
+# Keep connections to the Fi MCP server warm so streaming requests don't pay
+# for a fresh TCP/TLS handshake each time a session is (re)opened.
+_FI_MCP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=100,
+    keepalive_expiry=300.0,
+)
+_FI_MCP_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+
+
+def _fi_mcp_http_client(headers=None, timeout=None, auth=None) -> httpx.AsyncClient:
+    """httpx client factory for the Fi MCP session with keep-alive tuned on."""
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout or httpx.Timeout(30.0, read=300.0),
+        auth=auth,
+        follow_redirects=True,
+        transport=httpx.AsyncHTTPTransport(
+            limits=_FI_MCP_LIMITS,
+            socket_options=_FI_MCP_SOCKET_OPTIONS,
+        ),
+    )
+
+
 # Configure financial data toolkit with extended timeouts for streaming scenarios
-financial_data_toolkit = MCPToolset(
-    connection_params=StreamableHTTPConnectionParams(
+financial_data_toolkit = get_toolset(
+    StreamableHTTPConnectionParams(
         url=fi_mcp_url,
         timeout=60.0 * 30.0,  # Extended connection timeout
         sse_read_timeout=60.0 * 30.0,  # 30 minutes read timeout for streaming
         terminate_on_close=False,  # Don't terminate server on close for session persistence
-        headers=None
+        headers=None,
+        httpx_client_factory=_fi_mcp_http_client,
     ),
     errlog=None
 )
+
+# Independent Fi fetchers bundled by fetch_full_financial_snapshot.
+FI_SNAPSHOT_TOOLS = (
+    "fetch_net_worth",
+    "fetch_bank_transactions",
+    "fetch_mf_transactions",
+    "fetch_stock_transactions",
+    "fetch_credit_report",
+    "fetch_epf_details",
+)
+
+
+async def fetch_full_financial_snapshot(tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Fetch the user's complete Fi Money data in one call.
+
+    Runs net worth, bank transactions, mutual fund transactions, stock
+    transactions, credit report and EPF details concurrently, so an initial
+    assessment costs one round trip instead of six.
+
+    Args:
+        tool_context (ToolContext): The tool context of the calling agent. Required.
+
+    Returns:
+        Dict[str, Any]: The result of each fetcher keyed by its tool name; a
+            fetcher that failed maps to {"error": <message>}.
+    """
+    tools = {tool.name: tool for tool in await financial_data_toolkit.get_tools()}
+    names = [name for name in FI_SNAPSHOT_TOOLS if name in tools]
+    results = await asyncio.gather(
+        *(tools[name].run_async(args={}, tool_context=tool_context) for name in names),
+        return_exceptions=True,
+    )
+    return {
+        name: {"error": str(result)} if isinstance(result, Exception) else result
+        for name, result in zip(names, results)
+    }
@@ -10,8 +10,8 @@
 #   }
 # }
 
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
 from google.adk.tools.mcp_tool.mcp_session_manager import StdioServerParameters, StdioConnectionParams
+from tools._toolset_pool import get_toolset
 
 import os
 
@@ -31,6 +31,4 @@ connection_params = StdioConnectionParams(
     timeout=60.0*30.0,
 )
 
-memory_toolkit = MCPToolset(
-            connection_params=connection_params,
-        )
+memory_toolkit = get_toolset(connection_params)
@@ -0,0 +1,86 @@
+import logging
+from typing import Any, Dict, List, Literal
+
+from google.adk.tools import ToolContext
+from pydantic import BaseModel, Field, ValidationError
+
+logger = logging.getLogger(__name__)
+
+
+Dimension = Literal[
+    "net_worth",
+    "spending_behavior",
+    "income_profile",
+    "risk_profile",
+    "life_stage_and_goals",
+    "habits_and_vices",
+    "tax_planning",
+    "financial_discipline",
+    "personality",
+]
+
+# Stable spending categories; enforced by the tool schema rather than prose.
+Category = Literal[
+    "food_delivery",
+    "rent",
+    "travel",
+    "alcohol",
+    "gambling",
+    "subscriptions",
+    "utilities",
+    "shopping",
+    "education",
+    "health",
+    "misc",
+]
+
+
+class Insight(BaseModel):
+    """One evidence-backed claim about a profile dimension."""
+
+    dimension: Dimension
+    categories: List[Category] = Field(
+        default_factory=list,
+        description="Spending categories the insight is about, if any.",
+    )
+    claim: str = Field(description="Concise statement of the insight.")
+    because: str = Field(description="Short rationale with concrete numbers/patterns.")
+    evidence: List[str] = Field(
+        default_factory=list,
+        description="Supporting record IDs like tx_123 or mf_456; empty if none.",
+    )
+    confidence: float = Field(ge=0.0, le=1.0, description="Certainty from 0.0 to 1.0.")
+
+
+class ProfileReport(BaseModel):
+    """The structured outcome of a financial profiling session."""
+
+    insights: List[Insight]
+
+
+def record_profile_report(report: ProfileReport, tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Record the structured financial profile produced by the analysis phase.
+
+    Call this once, after analyzing the user's financial data, with one insight
+    per profile dimension. The report is kept in session state under
+    'profile_report' so it can be consumed without parsing free text.
+
+    Args:
+        report (ProfileReport): The insights, one per dimension. Required.
+        tool_context (ToolContext): The tool context holding session state. Required.
+
+    Returns:
+        Dict[str, Any]: {"status": "recorded", "insights": <count>}, or
+            {"error": ...} if the report does not match the schema.
+    """
+    if isinstance(report, dict):
+        try:
+            report = ProfileReport.model_validate(report)
+        except ValidationError as e:
+            # Let the model fix the payload and call again.
+            logger.warning("Invalid profile report: %s", e)
+            return {"error": str(e)}
+    tool_context.state["profile_report"] = report.model_dump()
+    logger.info("Recorded profile report with %d insights", len(report.insights))
+    return {"status": "recorded", "insights": len(report.insights)}
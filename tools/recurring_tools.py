@@ -0,0 +1,162 @@
+import json
+import logging
+import re
+import statistics
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from google.adk.tools import ToolContext
+from google.adk.tools.base_tool import BaseTool
+
+logger = logging.getLogger(__name__)
+
+# Fi MCP tool whose output the recurring streams are derived from.
+FI_BANK_TRANSACTIONS_TOOL = "fetch_bank_transactions"
+# Fi transaction types: 1 CREDIT, 2 DEBIT, 6 INSTALLMENT; the rest are balances,
+# interest or TDS entries and never form streams.
+_TX_DIRECTIONS = {1: "inflow", 2: "outflow", 6: "outflow"}
+_MIN_OCCURRENCES = 3
+_STATE_KEY = "recurring_streams"
+
+_NON_ALPHA = re.compile(r"[^a-z ]+")
+_SPACES = re.compile(r"\s+")
+
+
+def _normalize_payee(narration: str) -> str:
+    """Reduces a narration like 'UPI-NETFLIX-1234@okaxis' to 'upi netflix okaxis'."""
+    return _SPACES.sub(" ", _NON_ALPHA.sub(" ", narration.lower())).strip()
+
+
+def detect_recurring_streams(transactions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Groups transactions into recurring streams by payee and direction.
+
+    Args:
+        transactions (List[Dict[str, Any]]): Items with 'id', 'amount' (float),
+            'narration' (str), 'date' (datetime.date) and 'direction'
+            ('inflow' or 'outflow').
+
+    Returns:
+        List[Dict[str, Any]]: One dict per stream with payee, direction,
+        cadence_days, next_date, amount stats, a 0-1 consistency score and the
+        related transaction ids, most consistent first.
+    """
+    groups: Dict[tuple, List[Dict[str, Any]]] = defaultdict(list)
+    for tx in transactions:
+        payee = _normalize_payee(tx["narration"])
+        if payee:
+            groups[(payee, tx["direction"])].append(tx)
+
+    streams = []
+    for (payee, direction), txs in groups.items():
+        if len(txs) < _MIN_OCCURRENCES:
+            continue
+        txs.sort(key=lambda tx: tx["date"])
+        gaps = [(b["date"] - a["date"]).days for a, b in zip(txs, txs[1:])]
+        if not all(gaps):
+            # Several payments on the same day are bursts, not a cadence.
+            continue
+        cadence = statistics.median(gaps)
+        amounts = [tx["amount"] for tx in txs]
+        mean_amount = statistics.fmean(amounts)
+        # Penalize both irregular timing and irregular amounts.
+        gap_spread = statistics.pstdev(gaps) / cadence
+        amount_spread = statistics.pstdev(amounts) / mean_amount if mean_amount else 1.0
+        consistency = max(0.0, 1.0 - gap_spread) * max(0.0, 1.0 - amount_spread)
+        streams.append({
+            "payee": payee,
+            "direction": direction,
+            "occurrences": len(txs),
+            "cadence_days": cadence,
+            "last_date": txs[-1]["date"].isoformat(),
+            "next_date": (txs[-1]["date"] + timedelta(days=round(cadence))).isoformat(),
+            "amount_mean": round(mean_amount, 2),
+            "amount_min": min(amounts),
+            "amount_max": max(amounts),
+            "consistency": round(consistency, 2),
+            "tx_ids": [tx["id"] for tx in txs],
+        })
+    streams.sort(key=lambda s: s["consistency"], reverse=True)
+    return streams
+
+
+def _parse_fi_bank_transactions(tool_response: Any) -> Optional[List[Dict[str, Any]]]:
+    """Extracts transactions from a `fetch_bank_transactions` MCP response."""
+    if not isinstance(tool_response, dict):
+        return None
+    for part in tool_response.get("content") or []:
+        text = part.get("text") if isinstance(part, dict) else None
+        if not text:
+            continue
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            continue
+        if not isinstance(payload, dict) or "bankTransactions" not in payload:
+            continue
+        transactions = []
+        for account in payload["bankTransactions"]:
+            bank = account.get("bank", "bank")
+            # Each txn is [amount, narration, date, type, mode, balance].
+            for i, txn in enumerate(account.get("txns", [])):
+                direction = _TX_DIRECTIONS.get(txn[3])
+                if direction is None:
+                    continue
+                try:
+                    transactions.append({
+                        "id": f"{bank}:{i}",
+                        "amount": float(txn[0]),
+                        "narration": txn[1],
+                        "date": date.fromisoformat(txn[2]),
+                        "direction": direction,
+                    })
+                except (TypeError, ValueError, IndexError):
+                    continue
+        return transactions
+    return None
+
+
+def capture_recurring_streams(
+        tool: BaseTool,
+        args: Dict[str, Any],
+        tool_context: ToolContext,
+        tool_response: Any,
+) -> Optional[Dict[str, Any]]:
+    """
+    after_tool_callback that derives recurring streams from Fi bank transactions.
+
+    The streams are stored in session state for `get_recurring_streams`; the
+    tool response itself is passed through unchanged.
+    """
+    if tool.name != FI_BANK_TRANSACTIONS_TOOL:
+        return None
+    transactions = _parse_fi_bank_transactions(tool_response)
+    if transactions is None:
+        return None
+    streams = detect_recurring_streams(transactions)
+    tool_context.state[_STATE_KEY] = streams
+    logger.info("Detected %d recurring streams from %d transactions", len(streams), len(transactions))
+    return None
+
+
+def get_recurring_streams(tool_context: ToolContext) -> Dict[str, Any]:
+    """
+    Get the user's recurring payment and income streams.
+
+    Covers subscriptions, EMIs, SIPs, rent, school fees, salary and other
+    inflows or outflows that repeat on a cadence. Streams are detected
+    deterministically from the bank transactions fetched in this session.
+
+    Args:
+        tool_context (ToolContext): The tool context holding session state. Required.
+
+    Returns:
+        Dict[str, Any]: {"streams": [...]} where each stream has payee, direction,
+            cadence_days, next_date, amount_mean/min/max, consistency (0-1) and
+            tx_ids; or {"error": ...} if bank transactions were not fetched yet.
+    """
+    streams = tool_context.state.get(_STATE_KEY)
+    if streams is None:
+        return {"error": f"Call {FI_BANK_TRANSACTIONS_TOOL} first."}
+    return {"streams": streams}
@@ -0,0 +1,63 @@
+from typing import Any
+
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Streamed incrementally; gzip would hold chunks back until a block fills.
+STREAMING_MEDIA_TYPES = (b"text/event-stream", b"application/x-ndjson")
+
+_IDENTITY = (b"content-encoding", b"identity")
+
+
+def _is_streaming(message: Message) -> bool:
+    for name, value in message.get("headers", ()):
+        if name.lower() == b"content-type":
+            return value.split(b";", 1)[0].strip() in STREAMING_MEDIA_TYPES
+    return False
+
+
+class StreamingAwareGZipMiddleware:
+    """GZipMiddleware that leaves event-stream and NDJSON responses alone.
+
+    GZipMiddleware passes through any response that already declares a
+    Content-Encoding, so streaming responses are marked `identity` on the way
+    into it and the mark is stripped again before they reach the client.
+    """
+
+    def __init__(self, app: ASGIApp, **gzip_options: Any):
+        self.app = app
+        self.gzip_options = gzip_options
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        marked = False
+
+        async def marked_app(scope: Scope, receive: Receive, gzip_send: Send) -> None:
+            async def mark(message: Message) -> None:
+                nonlocal marked
+                if message["type"] == "http.response.start" and _is_streaming(message):
+                    marked = True
+                    message = {
+                        **message,
+                        "headers": [*message.get("headers", ()), _IDENTITY],
+                    }
+                await gzip_send(message)
+
+            await self.app(scope, receive, mark)
+
+        async def unmark(message: Message) -> None:
+            if marked and message["type"] == "http.response.start":
+                message = {
+                    **message,
+                    "headers": [
+                        (name, value)
+                        for name, value in message["headers"]
+                        if (name.lower(), value) != _IDENTITY
+                    ],
+                }
+            await send(message)
+
+        await GZipMiddleware(marked_app, **self.gzip_options)(scope, receive, unmark)
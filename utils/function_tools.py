@@ -0,0 +1,20 @@
+from typing import Optional
+
+from google.adk.tools.function_tool import FunctionTool
+from google.genai import types
+
+
+class CachedDeclarationFunctionTool(FunctionTool):
+    """FunctionTool that builds its function declaration only once.
+
+    FunctionTool re-derives the declaration from the function's signature and
+    docstring on every model call; for a fixed function the result never
+    changes.
+    """
+
+    _declaration: Optional[types.FunctionDeclaration] = None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        if self._declaration is None:
+            self._declaration = super()._get_declaration()
+        return self._declaration
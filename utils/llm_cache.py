@@ -0,0 +1,136 @@
+import collections
+import hashlib
+import logging
+import os
+import time
+from typing import Optional
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+logger = logging.getLogger(__name__)
+
+# Completed model responses kept in process, keyed by a hash of the user and
+# the request. Entries expire so a profile is re-derived at least hourly even
+# if the user's data snapshot looks unchanged.
+_LLM_CACHE_SIZE = int(os.environ.get("ADK_LLM_CACHE_SIZE", "256"))
+_LLM_CACHE_TTL_SECONDS = float(os.environ.get("ADK_LLM_CACHE_TTL", "3600"))
+
+# key -> (expires_at, response)
+_cache: collections.OrderedDict[str, tuple[float, LlmResponse]] = (
+    collections.OrderedDict()
+)
+# Model call in flight per invocation, from before_model_callback until the
+# next call (or a cache hit) replaces it: [request key, complete responses seen].
+# Bounded as well: a failed model call never reaches after_model_callback.
+_pending: collections.OrderedDict[str, list] = collections.OrderedDict()
+
+
+def _request_key(user_id: str, llm_request: LlmRequest) -> str:
+    """Hashes the user and everything the model sees: model, config and conversation.
+
+    The config carries the system instruction and tool declarations, the
+    contents carry every user turn and tool result, i.e. the data snapshot.
+    """
+    h = hashlib.sha256()
+    h.update(user_id.encode())
+    h.update(b"\0")
+    h.update((llm_request.model or "").encode())
+    if llm_request.config is not None:
+        h.update(llm_request.config.model_dump_json(exclude_none=True).encode())
+    for content in llm_request.contents:
+        h.update(content.model_dump_json(exclude_none=True).encode())
+    return h.hexdigest()
+
+
+def serve_cached_response(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> Optional[LlmResponse]:
+    """before_model_callback that answers repeated requests from the cache.
+
+    Args:
+        callback_context: The callback context of the current invocation.
+        llm_request: The request about to be sent to the model.
+
+    Returns:
+        A copy of the cached response on a hit, otherwise None so the model
+        is called.
+    """
+    key = _request_key(
+        callback_context._invocation_context.user_id, llm_request
+    )
+    entry = _cache.get(key)
+    if entry is not None and entry[0] <= time.monotonic():
+        del _cache[key]
+        entry = None
+    if entry is not None:
+        _pending.pop(callback_context.invocation_id, None)
+        _cache.move_to_end(key)
+        cached = entry[1]
+        usage = cached.usage_metadata
+        logger.info(
+            "LLM cache hit for %s, tokens saved: %s",
+            callback_context.agent_name,
+            usage.total_token_count if usage else "unknown",
+        )
+        return cached.model_copy(deep=True)
+    _pending[callback_context.invocation_id] = [key, 0]
+    _pending.move_to_end(callback_context.invocation_id)
+    if len(_pending) > _LLM_CACHE_SIZE:
+        _pending.popitem(last=False)
+    return None
+
+
+def store_response(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> Optional[LlmResponse]:
+    """after_model_callback that caches complete, successful text-only responses.
+
+    Only a model call answered by exactly one complete response without
+    function calls is cached. Replaying a tool call would re-run its side
+    effects (e.g. memory writes), and in SSE streaming mode a text turn
+    followed by a function call arrives as several complete responses, which
+    a single cached response could not reproduce; such calls are never cached.
+
+    Args:
+        callback_context: The callback context of the current invocation.
+        llm_response: The response returned by the model.
+
+    Returns:
+        None, leaving the response unchanged.
+    """
+    if llm_response.partial:
+        return None
+    pending = _pending.get(callback_context.invocation_id)
+    if pending is None:
+        return None
+    key = pending[0]
+    pending[1] += 1
+    content = llm_response.content
+    has_function_call = content is not None and any(
+        part.function_call for part in content.parts or []
+    )
+    if pending[1] > 1 or has_function_call or llm_response.error_code:
+        # Not replayable as one response: drop anything stored for this call.
+        del _pending[callback_context.invocation_id]
+        _cache.pop(key, None)
+        return None
+    if not content:
+        return None
+    _cache[key] = (
+        time.monotonic() + _LLM_CACHE_TTL_SECONDS,
+        llm_response.model_copy(deep=True),
+    )
+    if len(_cache) > _LLM_CACHE_SIZE:
+        _cache.popitem(last=False)
+    usage = llm_response.usage_metadata
+    if usage is not None:
+        logger.debug(
+            "Cached LLM response for %s: prompt=%s cached_prompt=%s output=%s",
+            callback_context.agent_name,
+            usage.prompt_token_count,
+            usage.cached_content_token_count,
+            usage.candidates_token_count,
+        )
+    return None
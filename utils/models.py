@@ -0,0 +1,53 @@
+import asyncio
+import os
+import weakref
+from typing import AsyncGenerator
+
+from google.adk.models.google_llm import Gemini
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+
+# Upper bound on in-flight Gemini calls across every agent in the process.
+# Bursts beyond it queue here instead of bouncing off provider 429s.
+GEMINI_MAX_CONCURRENT = int(os.environ.get("GEMINI_MAX_CONCURRENT", "16"))
+
+# One semaphore per event loop: an asyncio.Semaphore binds to the first loop
+# that waits on it, and scripts or tests may run agents on other loops.
+_llm_sems: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def llm_sem() -> asyncio.Semaphore:
+    """Returns the Gemini call semaphore of the running event loop."""
+    loop = asyncio.get_running_loop()
+    sem = _llm_sems.get(loop)
+    if sem is None:
+        sem = _llm_sems[loop] = asyncio.Semaphore(GEMINI_MAX_CONCURRENT)
+    return sem
+
+
+class ThrottledGemini(Gemini):
+    """Gemini model whose calls share the running loop's `llm_sem()`."""
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        # Hold a permit only while waiting on the model. The caller runs tools
+        # (including sub-agents that need permits of their own) and may apply
+        # client backpressure while this generator is paused at `yield`.
+        sem = llm_sem()
+        agen = super().generate_content_async(llm_request, stream)
+        try:
+            while True:
+                async with sem:
+                    try:
+                        llm_response = await agen.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield llm_response
+        finally:
+            await agen.aclose()
+
+
+def gemini(model: str) -> ThrottledGemini:
+    """Returns the throttled model to pass as an agent's `model`."""
+    return ThrottledGemini(model=model)
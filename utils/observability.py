@@ -0,0 +1,82 @@
+import threading
+from typing import Optional
+
+from opentelemetry import trace
+from opentelemetry.context import Context
+from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor, TracerProvider, export
+from opentelemetry.sdk.trace.sampling import TraceIdRatioBased
+
+from utils.tracing import CloudTraceLoggingSpanExporter
+
+_init_lock = threading.Lock()
+_initialized = False
+
+
+class TraceRatioSpanProcessor(SpanProcessor):
+    """Forwards the spans of a fixed fraction of traces to the wrapped processor.
+
+    Sampling here, rather than in the provider's sampler, keeps every span
+    recorded for the in-process exporters (the dev UI's trace views) while
+    only `ratio` of traces are exported. The decision depends only on the
+    trace id, so a trace is exported whole or not at all.
+    """
+
+    def __init__(self, processor: SpanProcessor, ratio: float):
+        self._processor = processor
+        self._bound = TraceIdRatioBased.get_bound_for_rate(ratio)
+
+    def _sampled(self, trace_id: int) -> bool:
+        return trace_id & TraceIdRatioBased.TRACE_ID_LIMIT < self._bound
+
+    def on_start(self, span: Span, parent_context: Optional[Context] = None) -> None:
+        if self._sampled(span.context.trace_id):
+            self._processor.on_start(span, parent_context=parent_context)
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if self._sampled(span.context.trace_id):
+            self._processor.on_end(span)
+
+    def shutdown(self) -> None:
+        self._processor.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._processor.force_flush(timeout_millis)
+
+
+def init_tracing(sample_ratio: float, trace_to_cloud: bool) -> None:
+    """Installs Cloud Trace export on the process-wide tracer provider, once.
+
+    Repeated calls, e.g. from a second entry point imported into the same
+    process, are no-ops, so spans are never processed by two providers or two
+    batch processors. If an SDK provider is already installed it is reused.
+    This owns Cloud export: pass `trace_to_cloud=False` to `get_fast_api_app`
+    so the app factory does not add a second Cloud Trace exporter.
+
+    Args:
+        sample_ratio: Fraction of traces exported to Cloud Trace. Spans are
+            still recorded for the in-process exporters.
+        trace_to_cloud: When False nothing is installed and spans stay no-ops.
+    """
+    global _initialized
+    with _init_lock:
+        if _initialized or not trace_to_cloud:
+            return
+        provider = trace.get_tracer_provider()
+        if not isinstance(provider, TracerProvider):
+            # Default sampler (honours OTEL_TRACES_SAMPLER*), so the debug
+            # exporters keep seeing every trace.
+            provider = TracerProvider()
+            trace.set_tracer_provider(provider)
+        provider.add_span_processor(
+            TraceRatioSpanProcessor(
+                export.BatchSpanProcessor(
+                    CloudTraceLoggingSpanExporter(),
+                    max_queue_size=10000,
+                    max_export_batch_size=512,
+                    schedule_delay_millis=2000,
+                    export_timeout_millis=15000,
+                ),
+                sample_ratio,
+            )
+        )
+        _initialized = True
@@ -0,0 +1,24 @@
+import hashlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def canonical_prompt(name: str, raw: str) -> str:
+    """Returns the prompt with trailing whitespace stripped from every line.
+
+    Provider prefix caches only hit on byte-identical prompts, so stray editor
+    whitespace would otherwise turn into silent cache misses. The content hash
+    is logged once at import, making prompt changes visible across deploys.
+
+    Args:
+        name: Name of the prompt, for the log line.
+        raw: The prompt text as written in the module.
+
+    Returns:
+        The canonical prompt text.
+    """
+    normalized = "\n".join(line.rstrip() for line in raw.splitlines()) + "\n"
+    digest = hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
+    logger.info("Prompt %s: %d chars, hash %s", name, len(normalized), digest)
+    return normalized
@@ -0,0 +1,78 @@
+import asyncio
+import functools
+import inspect
+import logging
+import random
+from typing import Any, Awaitable, Callable, TypeVar
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Failures where the request never reached (or was refused by) the server, so
+# retrying cannot apply a write twice.
+_TRANSIENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_TRANSIENT_STATUS = {"429", "503"}
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, _TRANSIENT_ERRORS):
+        return True
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "code", None) or getattr(response, "status_code", None)
+    return str(status) in _TRANSIENT_STATUS
+
+
+async def call_with_retries(
+    coro_fn: Callable[[], Awaitable[T]],
+    *,
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    jitter: bool = True,
+) -> T:
+    """Awaits `coro_fn()`, retrying transient failures with exponential backoff.
+
+    Args:
+        coro_fn: Zero-argument callable returning a fresh awaitable per attempt.
+        attempts: Total number of attempts, including the first.
+        base_delay: Delay before the first retry; doubled on each further one.
+        jitter: Whether to add up to 0.25s of random delay to each wait.
+
+    Returns:
+        The result of the first successful attempt.
+    """
+    for attempt in range(attempts):
+        try:
+            return await coro_fn()
+        except Exception as e:
+            if attempt == attempts - 1 or not _is_transient(e):
+                raise
+            delay = base_delay * 2**attempt + (random.random() * 0.25 if jitter else 0.0)
+            logger.warning(
+                "Transient failure (%s), retry %d/%d in %.2fs",
+                e, attempt + 1, attempts - 1, delay,
+            )
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+def with_retries(func: Callable[..., Any], **retry_kwargs: Any) -> Callable[..., Awaitable[Any]]:
+    """Wraps a tool function so each call goes through `call_with_retries`.
+
+    The wrapper keeps the function's name, docstring and signature, so ADK
+    builds the same tool declaration. Synchronous functions run in a worker
+    thread instead of blocking the event loop.
+    """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await call_with_retries(lambda: func(*args, **kwargs), **retry_kwargs)
+    else:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await call_with_retries(
+                lambda: asyncio.to_thread(func, *args, **kwargs), **retry_kwargs
+            )
+    return wrapper